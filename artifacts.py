@@ -0,0 +1,204 @@
+import argparse
+import os
+import struct
+
+import numpy as np
+
+from des import des_smooth
+from ingest import ingest
+
+# ====================== MODEL ARTIFACTS ======================
+# Setelah DES di-fit, forecast hanya butuh state akhir (S', S'', a, b), alpha,
+# tahun terakhir dan residual (untuk interval). File artifact berisi ribuan -
+# jutaan model dengan layout biner tetap sehingga bisa di-memory-map:
+#
+#   [header 64 byte]  magic "GINIDES\0", versi, jumlah series, jumlah residual, lebar id
+#   [records]         array terstruktur record_dtype(lebar id), urut berdasarkan id
+#   [residuals]       float64 flat; tiap record menyimpan offset & panjangnya
+#
+# Contoh CLI:
+#   python artifacts.py build data/ --alpha 0.6 --out models.gdes
+#   python artifacts.py forecast models.gdes --id "dataset.xlsx|Sheet1|gini_disp" --periods 5
+
+MAGIC = b"GINIDES\0"
+VERSION = 2
+HEADER = struct.Struct("<8sHxxxxxxQQQ")  # magic, versi, n_series, n_residuals, lebar id (byte)
+HEADER_SIZE = 64
+# Versi 1 memakai id dengan lebar tetap (field lebar id di header masih kosong)
+V1_ID_SIZE = 96
+
+_FIELDS = [
+    ("alpha", "<f8"),
+    ("last_year", "<i8"),
+    ("n_obs", "<i8"),
+    ("S1", "<f8"),
+    ("S2", "<f8"),
+    ("a", "<f8"),
+    ("b", "<f8"),
+    ("sigma", "<f8"),
+    ("resid_offset", "<i8"),
+    ("resid_len", "<i8"),
+]
+
+
+def record_dtype(id_size):
+    """Layout record; id UTF-8 selebar id terpanjang di file (ditentukan saat menulis)."""
+    return np.dtype([("id", f"S{max(1, id_size)}")] + _FIELDS)
+
+
+def fit_record(series_id, years, Y, alpha):
+    """Fit DES dan kembalikan (record, residual in-sample)."""
+    model = des_smooth(Y, alpha)
+    residuals = np.asarray(Y, dtype=float)[1:] - model["forecast"][1:]
+    key = series_id.encode("utf-8")
+    rec = np.zeros((), dtype=record_dtype(len(key)))
+    rec["id"] = key
+    rec["alpha"] = alpha
+    rec["last_year"] = int(years[-1])
+    rec["n_obs"] = len(Y)
+    rec["S1"], rec["S2"] = model["S1"][-1], model["S2"][-1]
+    rec["a"], rec["b"] = model["a"][-1], model["b"][-1]
+    rec["sigma"] = float(np.sqrt(np.mean(residuals ** 2))) if len(residuals) else 0.0
+    return rec, residuals
+
+
+def write_artifacts(path, fitted):
+    """Tulis daftar (record, residual) ke `path` secara atomik."""
+    id_size = max((r.dtype["id"].itemsize for r, _ in fitted), default=1)
+    records = np.zeros(len(fitted), dtype=record_dtype(id_size))
+    for name in records.dtype.names:
+        records[name] = [r[name] for r, _ in fitted]
+    residuals = [np.asarray(res, dtype="<f8") for _, res in fitted]
+    order = np.argsort(records["id"], kind="stable")
+    records = records[order]
+    residuals = [residuals[i] for i in order]
+    if len(records) > 1 and (records["id"][1:] == records["id"][:-1]).any():
+        raise ValueError("id series duplikat")
+    lengths = np.array([len(r) for r in residuals], dtype=np.int64)
+    records["resid_len"] = lengths
+    records["resid_offset"] = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(lengths) else []
+    flat = np.concatenate(residuals) if residuals else np.empty(0, dtype="<f8")
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records), len(flat), id_size).ljust(HEADER_SIZE, b"\0"))
+        f.write(records.tobytes())
+        f.write(flat.astype("<f8").tobytes())
+    os.replace(tmp, path)
+    return len(records)
+
+
+def _h_step_std(sigma, alpha, periods_ahead):
+    # Var(e_h) = σ² [1 + Σ_{j=1}^{h-1} (α(2-α) + j·α²)²]  (bentuk error-correction Brown DES)
+    j = np.arange(periods_ahead)
+    terms = (alpha[:, None] * (2 - alpha[:, None]) + j * alpha[:, None] ** 2) ** 2
+    terms[:, 0] = 0.0
+    return sigma[:, None] * np.sqrt(1 + np.cumsum(terms, axis=1))
+
+
+class ModelStore:
+    """Akses read-only ke file artifact lewat memory-map (tanpa memuat seluruh file)."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, n_series, n_resid, id_size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} bukan file artifact model DES")
+        if version not in (1, VERSION):
+            raise ValueError(f"Versi artifact {version} tidak didukung (butuh {VERSION})")
+        if version == 1:
+            id_size = V1_ID_SIZE
+        self.path = path
+        dtype = record_dtype(id_size)
+        self.records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(n_series,))
+        resid_offset = HEADER_SIZE + n_series * dtype.itemsize
+        self.residual_block = (np.memmap(path, dtype="<f8", mode="r", offset=resid_offset, shape=(n_resid,))
+                               if n_resid else np.empty(0))
+
+    def __len__(self):
+        return len(self.records)
+
+    def rows(self, series_ids):
+        """Indeks record untuk satu/lebih id (binary search pada id yang sudah terurut)."""
+        raw = [s.encode("utf-8") if isinstance(s, str) else bytes(s) for s in np.atleast_1d(series_ids)]
+        ids = self.records["id"]
+        keys = np.array(raw, dtype=ids.dtype)
+        pos = np.searchsorted(ids, keys)
+        # Id yang lebih lebar dari kolom id pasti tidak ada (jangan cocokkan versi terpotongnya)
+        fits = np.array([len(k) <= ids.dtype.itemsize for k in raw], dtype=bool)
+        found = fits & (pos < len(ids)) & (ids[np.minimum(pos, len(ids) - 1)] == keys)
+        if not found.all():
+            missing = [k.decode("utf-8", "replace") for k, ok in zip(raw, found) if not ok]
+            raise KeyError(f"Series tidak ditemukan: {missing[:5]}")
+        return pos
+
+    def residuals(self, series_id):
+        rec = self.records[self.rows(series_id)[0]]
+        return self.residual_block[rec["resid_offset"]:rec["resid_offset"] + rec["resid_len"]]
+
+    def forecast(self, series_ids=None, periods_ahead=5, interval=None):
+        """Forecast vektor untuk banyak series: dict years, forecast (n, h) dan opsional lower/upper.
+
+        `interval` = nilai z (mis. 1.96 untuk 95%); None tanpa interval.
+        """
+        rec = self.records if series_ids is None else self.records[self.rows(series_ids)]
+        a, b = np.asarray(rec["a"]), np.asarray(rec["b"])
+        m = np.arange(1, periods_ahead + 1)
+        out = {
+            "ids": np.char.decode(rec["id"], "utf-8"),
+            "years": np.asarray(rec["last_year"])[:, None] + m,
+            "forecast": a[:, None] + b[:, None] * m if len(rec) else np.empty((0, periods_ahead)),
+        }
+        if interval is not None:
+            std = _h_step_std(np.asarray(rec["sigma"]), np.asarray(rec["alpha"]), periods_ahead)
+            out["lower"] = out["forecast"] - interval * std
+            out["upper"] = out["forecast"] + interval * std
+        return out
+
+
+def build_from_panel(panel, alpha, cols=("gini_disp",)):
+    """Fit semua (source, sheet, kolom) pada panel hasil `ingest.ingest`."""
+    fitted = []
+    for (source, sheet), df in panel.groupby(["source", "sheet"], observed=True, sort=False):
+        df = df.sort_values("Year")
+        for col in cols:
+            s = df[["Year", col]].copy()
+            s[col] = s[col].interpolate(method="linear")
+            s = s.dropna()
+            if len(s) < 2:
+                continue
+            fitted.append(fit_record(f"{source}|{sheet}|{col}", s["Year"].to_numpy(), s[col].to_numpy(float), alpha))
+    return fitted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build/serve artifact model DES")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Fit dari file data lalu tulis artifact")
+    p_build.add_argument("inputs", nargs="+")
+    p_build.add_argument("--alpha", type=float, default=0.6)
+    p_build.add_argument("--cols", nargs="+", default=["gini_disp"])
+    p_build.add_argument("--workers", type=int, default=None)
+    p_build.add_argument("--out", required=True)
+    p_fc = sub.add_parser("forecast", help="Forecast dari artifact tanpa refit")
+    p_fc.add_argument("path")
+    p_fc.add_argument("--id", nargs="*", default=None)
+    p_fc.add_argument("--periods", type=int, default=5)
+    p_fc.add_argument("--z", type=float, default=1.96)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        panel, _ = ingest(args.inputs, args.workers)
+        n = write_artifacts(args.out, build_from_panel(panel, args.alpha, args.cols))
+        print(f"{n} model ditulis ke {args.out} ({os.path.getsize(args.out) / 1024:.1f} KB)")
+    else:
+        store = ModelStore(args.path)
+        res = store.forecast(args.id, args.periods, interval=args.z)
+        for i, sid in enumerate(res["ids"][:20]):
+            values = ", ".join(f"{y}: {f:.4f} [{lo:.4f}, {hi:.4f}]" for y, f, lo, hi in
+                               zip(res["years"][i], res["forecast"][i], res["lower"][i], res["upper"][i]))
+            print(f"{sid}  {values}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import io
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+import altair as alt
+
+from downsample import downsample
+
+# ====================== CHART BACKENDS ======================
+# "matplotlib": dirender di server sebagai gambar. Figure dibuat langsung (bukan
+#               lewat pyplot) agar tidak terdaftar di state global pyplot dan
+#               ikut dibebaskan begitu tidak direferensikan lagi.
+# "altair": hanya data JSON yang dikirim, chart Vega-Lite dirender di browser
+#           (zoom & hover tersedia, CPU server tidak terpakai untuk rasterisasi).
+CHART_BACKENDS = ("matplotlib", "altair")
+
+BG_COLOR = '#0E1117'
+PANEL_COLOR = '#1a202c'
+BORDER_COLOR = '#334155'
+TEXT_COLOR = 'white'
+# Format sumbu tahun: 2020 untuk data tahunan, 2020.25 untuk kuartalan/bulanan
+X_FORMAT = '~r'
+
+# Marker matplotlib -> shape Vega-Lite
+_ALT_SHAPES = {'o': 'circle', 'x': 'cross', 's': 'square'}
+
+
+def _check_backend(backend):
+    if backend not in CHART_BACKENDS:
+        raise ValueError(f"Backend grafik tidak dikenal: {backend}")
+
+
+def snapshot(chart):
+    """Bentuk grafik yang aman dipakai bersama antar sesi: PNG untuk matplotlib, spec JSON untuk Altair.
+
+    Objek Figure/Chart tidak thread-safe (st.pyplot memanggil savefig pada objek
+    yang sama dari beberapa thread), jadi cache proses menyimpan hasil render ini.
+    """
+    if isinstance(chart, Figure):
+        buf = io.BytesIO()
+        # Sama dengan pengaturan st.pyplot
+        chart.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+        return {"backend": "matplotlib", "png": buf.getvalue()}
+    return {"backend": "altair", "spec": chart.to_json()}
+
+
+def _style_mpl(fig, ax, title, xlabel, ylabel, legend):
+    ax.set_title(title, fontsize=14, fontweight='bold', color=TEXT_COLOR)
+    ax.set_xlabel(xlabel, fontsize=12, color=TEXT_COLOR)
+    ax.set_ylabel(ylabel, fontsize=12, color=TEXT_COLOR)
+    ax.set_facecolor(BG_COLOR)
+    fig.patch.set_facecolor(BG_COLOR)
+    ax.tick_params(colors=TEXT_COLOR)
+    if legend:
+        ax.legend(facecolor=PANEL_COLOR, edgecolor=BORDER_COLOR, labelcolor=TEXT_COLOR)
+
+
+def _style_alt(chart, title, width, height):
+    return chart.properties(
+        title=title, width=width, height=height, background=BG_COLOR
+    ).configure_view(
+        fill=BG_COLOR, stroke=BORDER_COLOR
+    ).configure_title(
+        color=TEXT_COLOR, fontSize=16, fontWeight='bold'
+    ).configure_axis(
+        labelColor=TEXT_COLOR, titleColor=TEXT_COLOR, gridOpacity=0.3, domainColor=BORDER_COLOR
+    ).configure_legend(
+        labelColor=TEXT_COLOR, titleColor=TEXT_COLOR, fillColor=PANEL_COLOR,
+        strokeColor=BORDER_COLOR, padding=8, orient='top-left'
+    )
+
+
+def line_chart(series, title, xlabel, ylabel, backend="matplotlib", max_points=None,
+               method="lttb", cutoff=None, figsize=(12, 6), legend=True):
+    """Grafik garis untuk beberapa series.
+
+    Setiap item `series` adalah dict dengan key x, y, label, color dan opsional
+    marker, linestyle, linewidth, markersize, alpha. Series di-downsample ke
+    `max_points` sebelum dirender pada kedua backend.
+    """
+    _check_backend(backend)
+    sampled = []
+    for s in series:
+        x, y = downsample(s['x'], s['y'], max_points, method=method)
+        sampled.append({**s, 'x': x, 'y': y})
+
+    if backend == "matplotlib":
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
+        for s in sampled:
+            ax.plot(s['x'], s['y'], marker=s.get('marker'), linestyle=s.get('linestyle', '-'),
+                    label=s.get('label'), color=s['color'], linewidth=s.get('linewidth', 2),
+                    markersize=s.get('markersize', 6), alpha=s.get('alpha', 1.0))
+        if cutoff is not None:
+            ax.axvline(x=cutoff, color='#EF4444', linestyle=':', alpha=0.7, label='Cutoff')
+        ax.grid(True, alpha=0.3)
+        _style_mpl(fig, ax, title, xlabel, ylabel, legend)
+        fig.tight_layout()
+        return fig
+
+    # Data long-form yang ringkas: hanya kolom x, y, series
+    data = pd.concat([
+        pd.DataFrame({'x': np.asarray(s['x'], dtype=float), 'y': np.asarray(s['y'], dtype=float),
+                      'series': s.get('label') or ylabel})
+        for s in sampled
+    ], ignore_index=True)
+    labels = [s.get('label') or ylabel for s in sampled]
+    color_scale = alt.Scale(domain=labels, range=[s['color'] for s in sampled])
+    dash_scale = alt.Scale(domain=labels, range=[[6, 4] if s.get('linestyle') == '--' else [1, 0] for s in sampled])
+    shape_scale = alt.Scale(domain=labels, range=[_ALT_SHAPES.get(s.get('marker'), 'circle') for s in sampled])
+    legend_cfg = alt.Legend(title=None) if legend else None
+    enc_x = alt.X('x:Q', title=xlabel, axis=alt.Axis(format=X_FORMAT), scale=alt.Scale(zero=False))
+    enc_y = alt.Y('y:Q', title=ylabel, scale=alt.Scale(zero=False))
+    tooltip = [alt.Tooltip('series:N', title='Series'), alt.Tooltip('x:Q', title=xlabel, format=X_FORMAT),
+               alt.Tooltip('y:Q', title=ylabel, format='.4f')]
+
+    base = alt.Chart(data).encode(x=enc_x, y=enc_y, color=alt.Color('series:N', scale=color_scale, legend=legend_cfg))
+    lines = base.mark_line(strokeWidth=2).encode(
+        strokeDash=alt.StrokeDash('series:N', scale=dash_scale, legend=None)
+    )
+    marked = [s.get('label') or ylabel for s in sampled if s.get('marker')]
+    points = base.transform_filter(
+        alt.FieldOneOfPredicate(field='series', oneOf=marked)
+    ).mark_point(filled=True, size=50).encode(
+        shape=alt.Shape('series:N', scale=shape_scale, legend=None), tooltip=tooltip
+    )
+    layers = [lines, points]
+    if cutoff is not None:
+        rule = alt.Chart(pd.DataFrame({'x': [float(cutoff)]})).mark_rule(
+            color='#EF4444', strokeDash=[2, 2], opacity=0.7
+        ).encode(x='x:Q')
+        layers.append(rule)
+    chart = alt.layer(*layers).interactive()
+    return _style_alt(chart, title, 'container', figsize[1] * 60)
+
+
+def box_chart(values, name, backend="matplotlib"):
+    """Boxplot satu kolom (whisker 1.5 × IQR, outlier ditandai merah)."""
+    _check_backend(backend)
+    values = pd.Series(values).dropna()
+
+    if backend == "matplotlib":
+        fig = Figure(figsize=(10, 7))
+        ax = fig.subplots()
+        bp = ax.boxplot(values, patch_artist=True, widths=0.5)
+        for patch in bp['boxes']:
+            patch.set_facecolor('#00E396')
+            patch.set_alpha(0.7)
+        for whisker in bp['whiskers']:
+            whisker.set(color='#00E396', linewidth=2)
+        for cap in bp['caps']:
+            cap.set(color='#00E396', linewidth=2)
+        for median in bp['medians']:
+            median.set(color='#FEB019', linewidth=2)
+        for flier in bp['fliers']:
+            flier.set(marker='o', color='#EF4444', markersize=8, alpha=0.8)
+        ax.set_xticks([1])
+        ax.set_xticklabels([name], color=TEXT_COLOR)
+        ax.grid(True, alpha=0.3, axis='y')
+        _style_mpl(fig, ax, f"Boxplot - {name}", "", name, legend=False)
+        fig.tight_layout()
+        return fig
+
+    data = pd.DataFrame({'kolom': name, 'nilai': values.to_numpy(dtype=float)})
+    chart = alt.Chart(data).mark_boxplot(
+        extent=1.5, size=80, color='#00E396', opacity=0.7,
+        median={'color': '#FEB019', 'strokeWidth': 2},
+        outliers={'color': '#EF4444', 'size': 60, 'filled': True}
+    ).encode(
+        x=alt.X('kolom:N', title=None, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y('nilai:Q', title=name, scale=alt.Scale(zero=False))
+    )
+    return _style_alt(chart, f"Boxplot - {name}", 'container', 420)
+
+
+def forecast_chart(years, Y, forecast, future_years, future_forecasts, alpha,
+                   backend="matplotlib", max_points=None, method="lttb", title=None):
+    """Grafik aktual vs forecast in-sample dan forecast ke depan dengan garis cutoff."""
+    forecast_clean = [f if f is not None else np.nan for f in forecast]
+    series = [
+        {'x': years, 'y': Y, 'label': 'Actual GINI', 'color': '#00E396', 'marker': 'o'},
+        {'x': years, 'y': forecast_clean, 'label': 'Forecast (In-sample)', 'color': '#00D1FF',
+         'marker': 'x', 'linestyle': '--'},
+        {'x': future_years, 'y': future_forecasts, 'label': 'Forecast (Future)', 'color': '#FEB019',
+         'marker': 's', 'linestyle': '--', 'markersize': 8},
+    ]
+    return line_chart(series, title or f'Forecasting Gini Coefficient (α = {alpha})', 'Year', 'GINI Coefficient',
+                      backend=backend, max_points=max_points, method=method, cutoff=years[-1])
+
+
+def fan_chart(years, Y, future_years, quantiles, baseline=None, threshold=None, title="",
+              backend="matplotlib", max_points=None, method="lttb"):
+    """Fan chart simulasi Monte Carlo: band 5-95% dan 25-75%, median, serta data aktual."""
+    _check_backend(backend)
+    fx = np.asarray(future_years, dtype=float)
+    q05, q25, q50, q75, q95 = (np.asarray(quantiles[q]) for q in (0.05, 0.25, 0.5, 0.75, 0.95))
+    x_act, y_act = downsample(years, Y, max_points, method=method)
+
+    if backend == "matplotlib":
+        fig = Figure(figsize=(12, 6))
+        ax = fig.subplots()
+        ax.plot(x_act, y_act, marker='o', label='Actual GINI', color='#00E396', linewidth=2, markersize=6)
+        ax.fill_between(fx, q05, q95, color='#FEB019', alpha=0.2, label='5% - 95%')
+        ax.fill_between(fx, q25, q75, color='#FEB019', alpha=0.4, label='25% - 75%')
+        ax.plot(fx, q50, color='#FEB019', linewidth=2, label='Median Skenario')
+        if baseline is not None:
+            ax.plot(fx, baseline, linestyle='--', color='#00D1FF', linewidth=2, label='Forecast Baseline')
+        if threshold is not None:
+            ax.axhline(y=threshold, color='#A78BFA', linestyle='-.', alpha=0.8, label='Threshold')
+        ax.axvline(x=years[-1], color='#EF4444', linestyle=':', alpha=0.7, label='Cutoff')
+        ax.grid(True, alpha=0.3)
+        _style_mpl(fig, ax, title, 'Year', 'GINI Coefficient', legend=True)
+        fig.tight_layout()
+        return fig
+
+    band = pd.DataFrame({'x': fx, 'q05': q05, 'q25': q25, 'q50': q50, 'q75': q75, 'q95': q95})
+    lines = [pd.DataFrame({'x': np.asarray(x_act, dtype=float), 'y': y_act, 'series': 'Actual GINI'}),
+             pd.DataFrame({'x': fx, 'y': q50, 'series': 'Median Skenario'})]
+    domain, colors = ['Actual GINI', 'Median Skenario'], ['#00E396', '#FEB019']
+    if baseline is not None:
+        lines.append(pd.DataFrame({'x': fx, 'y': np.asarray(baseline, dtype=float), 'series': 'Forecast Baseline'}))
+        domain.append('Forecast Baseline')
+        colors.append('#00D1FF')
+    enc_x = alt.X('x:Q', title='Year', axis=alt.Axis(format=X_FORMAT), scale=alt.Scale(zero=False))
+    outer = alt.Chart(band).mark_area(color='#FEB019', opacity=0.2).encode(
+        x=enc_x, y=alt.Y('q05:Q', title='GINI Coefficient', scale=alt.Scale(zero=False)), y2='q95:Q',
+        tooltip=[alt.Tooltip('x:Q', title='Year', format=X_FORMAT)] +
+                [alt.Tooltip(f'{c}:Q', format='.4f') for c in ('q05', 'q25', 'q50', 'q75', 'q95')]
+    )
+    inner = alt.Chart(band).mark_area(color='#FEB019', opacity=0.4).encode(x=enc_x, y='q25:Q', y2='q75:Q')
+    line = alt.Chart(pd.concat(lines, ignore_index=True)).mark_line(strokeWidth=2).encode(
+        x=enc_x, y='y:Q',
+        color=alt.Color('series:N', scale=alt.Scale(domain=domain, range=colors), legend=alt.Legend(title=None)),
+        tooltip=[alt.Tooltip('series:N'), alt.Tooltip('x:Q', format=X_FORMAT), alt.Tooltip('y:Q', format='.4f')]
+    )
+    layers = [outer, inner, line,
+              alt.Chart(pd.DataFrame({'x': [float(years[-1])]})).mark_rule(
+                  color='#EF4444', strokeDash=[2, 2], opacity=0.7).encode(x='x:Q')]
+    if threshold is not None:
+        layers.append(alt.Chart(pd.DataFrame({'y': [float(threshold)]})).mark_rule(
+            color='#A78BFA', strokeDash=[6, 3]).encode(y='y:Q'))
+    return _style_alt(alt.layer(*layers).interactive(), title, 'container', 360)
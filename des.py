@@ -0,0 +1,88 @@
+import numpy as np
+
+from metrics import compute_metrics
+
+# ====================== DOUBLE EXPONENTIAL SMOOTHING (BROWN) ======================
+
+
+def prepare_series(df_raw, col='gini_disp', freq='Y'):
+    # Lakukan interpolasi agar time series tidak bolong
+    df_clean = df_raw[['Year', col]].sort_values('Year').reset_index(drop=True)
+    df_clean[col] = df_clean[col].interpolate(method='linear')
+    df_clean = df_clean.dropna()  # Drop rows yang masih NaN (misal di awal/akhir)
+
+    Y = df_clean[col].values.astype(float)
+    # Year tahunan = integer; data kuartalan/bulanan memakai tahun pecahan (2020.25, ...)
+    years = df_clean['Year'].values.astype(int if freq == 'Y' else float)
+    return years, Y
+
+
+def des_smooth(Y, alpha):
+    """Hitung S', S'', a, b dan forecast in-sample.
+
+    forecast[0] bernilai NaN karena forecast pertama baru tersedia di t = 1.
+    """
+    Y = np.asarray(Y, dtype=float)
+    n = len(Y)
+
+    S1 = np.empty(n)
+    S2 = np.empty(n)
+    S1[0] = Y[0]
+    S2[0] = Y[0]
+    for t in range(1, n):
+        S1[t] = alpha * Y[t] + (1 - alpha) * S1[t-1]
+        S2[t] = alpha * S1[t] + (1 - alpha) * S2[t-1]
+
+    a = 2 * S1 - S2
+    b = (alpha / (1 - alpha)) * (S1 - S2) if (1 - alpha) != 0 else np.zeros(n)
+
+    forecast = np.full(n, np.nan)
+    forecast[1:] = a[:-1] + b[:-1]
+    return {"S1": S1, "S2": S2, "a": a, "b": b, "forecast": forecast}
+
+
+def des_forecast(a_last, b_last, periods_ahead):
+    # Ft+m = at + bt × m
+    m = np.arange(1, periods_ahead + 1)
+    return a_last + b_last * m
+
+
+def des_fit(Y, alpha, periods_ahead):
+    """Hitung S', S'', a, b, forecast in-sample dan forecast m periode ke depan."""
+    res = des_smooth(Y, alpha)
+    res["future_forecasts"] = des_forecast(res["a"][-1], res["b"][-1], periods_ahead)
+    return res
+
+
+def des_backtest(Y, alpha, horizon=1, min_train=5):
+    """Rolling-origin backtest: forecast 1..horizon langkah dari setiap origin.
+
+    Rekursi DES kausal, jadi state di origin t sama dengan fit ulang pada Y[:t+1];
+    cukup satu kali smoothing. Hasil: alpha + MAE/RMSE/MAPE per horizon (array)
+    dan rata-ratanya.
+    """
+    Y = np.asarray(Y, dtype=float)
+    res = des_smooth(Y, alpha)
+    m = np.arange(1, horizon + 1)
+    origins = np.arange(min_train - 1, len(Y) - horizon)
+    if len(origins) == 0:
+        raise ValueError(f"Data terlalu pendek untuk backtest (n = {len(Y)}, min_train = {min_train}, horizon = {horizon})")
+    predicted = res["a"][origins, None] + res["b"][origins, None] * m
+    actual = Y[origins[:, None] + m]
+    metrics = compute_metrics(actual.T, predicted.T)
+    out = {"alpha": alpha, "n_origins": len(origins)}
+    for name in ("MAE", "RMSE", "MAPE"):
+        out[f"{name}_h"] = metrics[name]
+        out[name] = float(np.mean(metrics[name]))
+    return out
+
+
+def mape_category(MAPE):
+    # (emoji, kategori) sesuai tabel interpretasi MAPE
+    if MAPE < 5:
+        return "🟢", "Sangat Baik"
+    if MAPE < 10:
+        return "🟡", "Baik"
+    if MAPE < 20:
+        return "🟠", "Cukup"
+    return "🔴", "Perlu Perbaikan"
@@ -0,0 +1,99 @@
+import numpy as np
+
+# ====================== DOWNSAMPLING TIME SERIES ======================
+# Mengurangi jumlah titik sebelum plotting agar biaya render grafik terbatas
+# berapapun panjang series, tanpa menghilangkan puncak/lembah yang penting.
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def _as_arrays(x, y):
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x dan y harus array 1-D dengan panjang sama")
+    return x, y
+
+
+def lttb_indices(x, y, max_points):
+    """Indeks titik terpilih dengan Largest-Triangle-Three-Buckets.
+
+    Titik pertama dan terakhir selalu dipertahankan (mis. cutoff forecast).
+    """
+    x, y = _as_arrays(x, y)
+    n = len(y)
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1])
+
+    xf = x.astype(float)
+    # Batas bucket untuk titik ke-1 .. n-2
+    edges = np.floor(np.linspace(1, n - 1, max_points - 1)).astype(int)
+    # Rata-rata tiap bucket dihitung sekaligus (dipakai sebagai titik "c")
+    counts = np.diff(edges)
+    finite = np.isfinite(y)
+    y0 = np.where(finite, y, 0.0)
+    m = n - 1
+    sum_x = np.add.reduceat(np.where(finite, xf, 0.0)[:m], edges[:-1])
+    sum_y = np.add.reduceat(y0[:m], edges[:-1])
+    cnt = np.add.reduceat(finite[:m].astype(float), edges[:-1])
+    cnt = np.where(counts > 0, cnt, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_x = np.where(cnt > 0, sum_x / cnt, np.nan)
+        avg_y = np.where(cnt > 0, sum_y / cnt, np.nan)
+    # Bucket terakhir menunjuk ke titik terakhir
+    avg_x = np.append(avg_x[1:], xf[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            selected[i + 1] = lo
+            continue
+        bx, by = xf[lo:hi], y[lo:hi]
+        area = np.abs((xf[a] - avg_x[i]) * (by - y[a]) - (xf[a] - bx) * (avg_y[i] - y[a]))
+        # Bucket tanpa nilai valid tetap menyumbang satu titik (gap tetap terlihat)
+        area = np.where(np.isfinite(area), area, -1.0)
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return np.unique(selected)
+
+
+def minmax_indices(x, y, max_points):
+    """Indeks titik minimum dan maksimum per bucket (envelope min-max)."""
+    x, y = _as_arrays(x, y)
+    n = len(y)
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    n_buckets = max(1, (max_points - 2) // 2)
+    starts = (np.arange(n_buckets) * n) // n_buckets
+    sizes = np.diff(np.append(starts, n))
+    # NaN diabaikan: diganti +inf untuk mencari minimum dan -inf untuk maksimum
+    y_lo = np.where(np.isnan(y), np.inf, y)
+    y_hi = np.where(np.isnan(y), -np.inf, y)
+    lo = np.flatnonzero(y_lo == np.repeat(np.minimum.reduceat(y_lo, starts), sizes))
+    hi = np.flatnonzero(y_hi == np.repeat(np.maximum.reduceat(y_hi, starts), sizes))
+    # Ambil kemunculan pertama di setiap bucket
+    idx_lo = lo[np.searchsorted(lo, starts)]
+    idx_hi = hi[np.searchsorted(hi, starts)]
+    idx = np.concatenate(([0, n - 1], idx_lo, idx_hi))
+    return np.unique(idx)
+
+
+def downsample(x, y, max_points, method="lttb"):
+    """Kembalikan (x, y) yang sudah dikurangi menjadi paling banyak ~max_points titik."""
+    x, y = _as_arrays(x, y)
+    if max_points is None or len(y) <= max_points:
+        return x, y
+    if method == "lttb":
+        idx = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        idx = minmax_indices(x, y, max_points)
+    else:
+        raise ValueError(f"Metode downsampling tidak dikenal: {method}")
+    return x[idx], y[idx]
@@ -0,0 +1,132 @@
+import numpy as np
+
+from des import des_smooth, des_forecast, des_fit
+
+# ====================== REGRESI DRIVER + DES ERROR ======================
+# gini_t = β0 + Σ βj · driver_j(t - lag_j) + u_t,   u_t dihaluskan dengan DES (Brown)
+# forecast_t = regresi_t + forecast DES residual
+#
+# Seleksi driver exhaustive: setiap driver tidak dipakai atau memakai satu lag
+# 0..max_lag, jadi ada (max_lag + 2)^k kandidat (k = 6 driver, max_lag = 2 ->
+# 4096 model). Semua kandidat memakai sampel yang sama (baris dengan semua lag
+# tersedia) sehingga AIC/BIC bisa dibandingkan. Gram matrix X'X dan X'y dari
+# seluruh kolom lag dihitung sekali (kolom distandarkan agar kondisinya baik);
+# setiap kandidat cukup mengambil sub-blok Gram-nya, dan kandidat dengan jumlah
+# driver yang sama diselesaikan bersama dengan np.linalg.solve ber-batch.
+
+DRIVER_COLUMNS = ('GDP', 'GOVEDU', 'GOVEXP', 'FINDEV 1', 'DEMOCRACY', 'FLABOUR')
+CRITERIA = ("BIC", "AIC")
+
+
+def lagged_design(df, target, drivers, max_lag):
+    """y dan semua kolom driver (lag 0..max_lag) pada sampel bersama tanpa NaN."""
+    d = df[['Year', target, *drivers]].sort_values('Year')
+    columns, X = [], []
+    for drv in drivers:
+        for lag in range(max_lag + 1):
+            X.append(d[drv].shift(lag).to_numpy(dtype=float))
+            columns.append(f"{drv} (t-{lag})" if lag else f"{drv} (t)")
+    y = d[target].to_numpy(dtype=float)
+    X = np.column_stack(X) if X else np.empty((len(d), 0))
+    ok = np.isfinite(y) & np.isfinite(X).all(axis=1)
+    return {"years": d['Year'].to_numpy()[ok], "y": y[ok], "X": X[ok], "columns": columns,
+            "drivers": list(drivers), "max_lag": max_lag}
+
+
+def candidate_lags(n_drivers, max_lag):
+    """Semua kombinasi lag per driver; -1 = driver tidak dipakai. Hasil (M, n_drivers)."""
+    choices = np.arange(-1, max_lag + 1)
+    grids = np.meshgrid(*[choices] * n_drivers, indexing="ij")
+    return np.stack([g.ravel() for g in grids], axis=1) if n_drivers else np.zeros((1, 0), dtype=int)
+
+
+def search_driver_models(design, criterion="BIC", ridge=1e-10):
+    """Evaluasi semua kandidat lewat Gram matrix bersama; hasil diurutkan menurut `criterion`.
+
+    Kembalikan dict array sejajar: lags (M, k), n_params, rss, r2_adj, aic, bic.
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"Kriteria tidak dikenal: {criterion} (pilih {list(CRITERIA)})")
+    X, y = design["X"], design["y"]
+    n, k, max_lag = len(y), len(design["drivers"]), design["max_lag"]
+    if n < 3:
+        raise ValueError(f"Sampel terlalu pendek untuk regresi driver (n = {n})")
+    # Intercept ditangani dengan centering; standardisasi menjaga kondisi Gram
+    scale = X.std(axis=0)
+    Z = (X - X.mean(axis=0)) / np.where(scale > 0, scale, 1.0)
+    yc = y - y.mean()
+    gram, xty, yty = Z.T @ Z, Z.T @ yc, float(yc @ yc)
+
+    lags = candidate_lags(k, max_lag)
+    used = lags >= 0
+    n_used = used.sum(axis=1)
+    rss = np.empty(len(lags))
+    for p in np.unique(n_used):
+        rows = np.flatnonzero(n_used == p)
+        if p == 0:
+            rss[rows] = yty
+            continue
+        # Indeks kolom Gram per kandidat: driver j dengan lag l -> kolom j * (max_lag + 1) + l
+        drv = np.nonzero(used[rows])[1].reshape(len(rows), p)
+        cols = drv * (max_lag + 1) + lags[rows[:, None], drv]
+        G = gram[cols[:, :, None], cols[:, None, :]] + ridge * n * np.eye(p)
+        c = xty[cols]
+        beta = np.linalg.solve(G, c[..., None])[..., 0]
+        rss[rows] = yty - np.einsum("mp,mp->m", c, beta)
+
+    rss = np.maximum(rss, 1e-12 * max(yty, 1e-12))
+    n_params = n_used + 1
+    log_lik_term = n * np.log(rss / n)
+    aic = log_lik_term + 2 * n_params
+    bic = log_lik_term + n_params * np.log(n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r2_adj = 1 - (rss / np.maximum(n - n_params, 1)) / (yty / max(n - 1, 1))
+    order = np.argsort(bic if criterion == "BIC" else aic, kind="stable")
+    return {"lags": lags[order], "n_params": n_params[order], "rss": rss[order], "r2_adj": r2_adj[order],
+            "aic": aic[order], "bic": bic[order], "criterion": criterion, "n_obs": n}
+
+
+def describe_lags(drivers, lags):
+    used = [f"{drv} (t-{lag})" if lag else f"{drv} (t)" for drv, lag in zip(drivers, lags) if lag >= 0]
+    return ", ".join(used) if used else "(tanpa driver)"
+
+
+def fit_driver_model(design, lags, alpha):
+    """OLS untuk kombinasi `lags` lalu DES pada residual; forecast in-sample = regresi + DES residual."""
+    lags = np.asarray(lags)
+    max_lag = design["max_lag"]
+    cols = [j * (max_lag + 1) + lag for j, lag in enumerate(lags) if lag >= 0]
+    X = np.column_stack([np.ones(len(design["y"])), design["X"][:, cols]])
+    coef, *_ = np.linalg.lstsq(X, design["y"], rcond=None)
+    fitted = X @ coef
+    resid = design["y"] - fitted
+    res = des_smooth(resid, alpha)
+    return {
+        "years": design["years"],
+        "lags": lags,
+        "coef_names": ["Intercept"] + [design["columns"][c] for c in cols],
+        "coef": coef,
+        "regression": fitted,
+        "residual": resid,
+        "a": res["a"],
+        "b": res["b"],
+        "forecast": fitted + res["forecast"],
+    }
+
+
+def forecast_driver_model(df, design, model, periods_ahead, alpha):
+    """Forecast ke depan. Nilai driver yang belum teramati diisi forecast DES driver itu sendiri."""
+    d = df[['Year', *design["drivers"]]].sort_values('Year')
+    last = int(np.searchsorted(d['Year'].to_numpy(), design["years"][-1]))
+    reg = np.full(periods_ahead, model["coef"][0])
+    k = 1
+    for drv, lag in zip(design["drivers"], model["lags"]):
+        if lag < 0:
+            continue
+        series = d[drv].to_numpy(dtype=float)[:last + 1]
+        series = series[np.isfinite(series)]
+        extended = np.concatenate([series, des_fit(series, alpha, periods_ahead)["future_forecasts"]])
+        # driver(T + h - lag), h = 1..periods_ahead
+        reg += model["coef"][k] * extended[len(series) - 1 + np.arange(1, periods_ahead + 1) - lag]
+        k += 1
+    return reg + des_forecast(model["a"][-1], model["b"][-1], periods_ahead)
@@ -0,0 +1,217 @@
+import numpy as np
+
+# ====================== HOLT-WINTERS (TRIPLE EXPONENTIAL SMOOTHING) ======================
+# Level, trend dan musiman dengan periode m, dalam bentuk error-correction
+# (setara dengan rumus Holt-Winters klasik):
+#
+#   additive       : ŷt = (Lt-1 + Tt-1) + St-m                e = Yt - ŷt
+#                    Lt = Lt-1 + Tt-1 + α·e
+#                    Tt = Tt-1 + α·β·e
+#                    St = St-m + γ·(1 - α)·e
+#   multiplicative : ŷt = (Lt-1 + Tt-1) · St-m                r = e / St-m
+#                    Lt = Lt-1 + Tt-1 + α·r
+#                    Tt = Tt-1 + α·β·r
+#                    St = St-m + γ·(Yt / Lt - St-m)
+#
+# Rekursi berjalan per waktu, tetapi setiap langkah memproses seluruh batch
+# (banyak series × banyak kombinasi α, β, γ) sekaligus sebagai array numpy.
+# Inisialisasi: level = rata-rata musim pertama, trend = selisih rata-rata musim
+# kedua dan pertama / m, indeks musiman = musim pertama relatif terhadap level.
+
+SEASONAL_TYPES = ("additive", "multiplicative")
+
+ALPHA_GRID = np.round(np.arange(0.1, 1.0, 0.1), 2)
+BETA_GRID = np.array([0.01, 0.05, 0.1, 0.2, 0.3, 0.5])
+GAMMA_GRID = np.array([0.01, 0.05, 0.1, 0.2, 0.3, 0.5])
+
+
+def _check(Y, season_length, seasonal):
+    if seasonal not in SEASONAL_TYPES:
+        raise ValueError(f"Jenis musiman tidak dikenal: {seasonal} (pilih {list(SEASONAL_TYPES)})")
+    m = int(season_length)
+    if m < 2:
+        raise ValueError("Panjang musim minimal 2")
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    if Y.shape[1] < 2 * m:
+        raise ValueError(f"Holt-Winters butuh minimal 2 musim data ({2 * m} titik), tersedia {Y.shape[1]}")
+    if not np.isfinite(Y).all():
+        raise ValueError("Series mengandung NaN/inf")
+    if seasonal == "multiplicative" and (Y <= 0).any():
+        raise ValueError("Musiman multiplicative butuh data positif")
+    return Y, m
+
+
+def _initial_states(Y, m, seasonal):
+    first = Y[:, :m].mean(axis=1)
+    second = Y[:, m:2 * m].mean(axis=1)
+    trend = (second - first) / m
+    season = Y[:, :m] - first[:, None] if seasonal == "additive" else Y[:, :m] / first[:, None]
+    return first, trend, season
+
+
+def _recurse(Y, m, seasonal, alpha, beta, gamma, keep_states):
+    """Jalankan rekursi untuk Y (S, n) dengan parameter berbentuk (1, G) atau (S, 1).
+
+    State berbentuk (S, G) / (S, 1). SSE one-step dihitung mulai t = m (musim
+    pertama dipakai untuk inisialisasi).
+    """
+    S, n = Y.shape
+    alpha, beta, gamma = (np.asarray(p, dtype=float) for p in (alpha, beta, gamma))
+    shape = np.broadcast_shapes((S, 1), alpha.shape, beta.shape, gamma.shape)
+    level0, trend0, season0 = _initial_states(Y, m, seasonal)
+    if shape == (1, 1):
+        return _recurse_scalar(Y[0], m, seasonal == "additive", float(level0[0]), float(trend0[0]),
+                               season0[0].tolist(), alpha.item(), beta.item(), gamma.item(), keep_states)
+    level = np.broadcast_to(level0[:, None], shape).copy()
+    trend = np.broadcast_to(trend0[:, None], shape).copy()
+    # Buffer musiman sirkular (m, ...) agar season[t % m] berupa view kontigu
+    season = np.broadcast_to(season0.T[:, :, None], (m,) + shape).copy()
+    gain_level = np.broadcast_to(alpha, shape)
+    gain_trend = np.broadcast_to(alpha * beta, shape)
+    gain_season = np.broadcast_to(gamma * (1 - alpha) if seasonal == "additive" else gamma, shape)
+    additive = seasonal == "additive"
+
+    Yt = np.ascontiguousarray(Y.T)[:, :, None]  # (n, S, 1): satu baris per waktu
+    sse = np.zeros(shape)
+    if keep_states:
+        hist = {k: np.empty((n,) + shape) for k in ("level", "trend", "season", "forecast")}
+    # Kombinasi parameter yang divergen cukup berakhir dengan SSE inf/NaN
+    with np.errstate(over="ignore", invalid="ignore"):
+        _loop(Yt, m, additive, level, trend, season, gain_level, gain_trend, gain_season, sse,
+              hist if keep_states else None)
+    # Indeks musiman untuk periode n+1 .. n+m
+    season_next = np.moveaxis(season[(n + np.arange(m)) % m], 0, -1)
+    out = {"level_last": level, "trend_last": trend, "season_next": season_next, "sse": sse}
+    if keep_states:
+        out.update({k: np.moveaxis(v, 0, -1) for k, v in hist.items()})
+    return out
+
+
+def _loop(Yt, m, additive, level, trend, season, gain_level, gain_trend, gain_season, sse, hist):
+    # level & trend diperbarui in-place agar pemanggil melihat state akhir
+    for t in range(len(Yt)):
+        y = Yt[t]
+        s = season[t % m]
+        base = level + trend
+        if additive:
+            err = y - base - s
+            level[...] = base + gain_level * err
+            trend += gain_trend * err
+            s += gain_season * err
+        else:
+            err = y - base * s
+            rel = err / s
+            level[...] = base + gain_level * rel
+            trend += gain_trend * rel
+            s += gain_season * (y / level - s)
+        if t >= m:
+            sse += err * err
+        if hist is not None:
+            hist["forecast"][t] = y - err
+            hist["level"][t] = level
+            hist["trend"][t] = trend
+            hist["season"][t] = s
+
+
+def _recurse_scalar(y_values, m, additive, level, trend, season, alpha, beta, gamma, keep_states):
+    # Satu series & satu kombinasi parameter: float Python jauh lebih cepat daripada array berukuran 1
+    n = len(y_values)
+    gain_trend = alpha * beta
+    gain_season = gamma * (1 - alpha) if additive else gamma
+    sse = 0.0
+    hist = {k: [0.0] * n for k in ("level", "trend", "season", "forecast")} if keep_states else None
+    for t, y in enumerate(y_values.tolist()):
+        k = t % m
+        s = season[k]
+        base = level + trend
+        if additive:
+            err = y - base - s
+            level = base + alpha * err
+            trend += gain_trend * err
+            s += gain_season * err
+        else:
+            err = y - base * s
+            rel = err / s
+            level = base + alpha * rel
+            trend += gain_trend * rel
+            s += gain_season * (y / level - s)
+        season[k] = s
+        if t >= m:
+            sse += err * err
+        if keep_states:
+            hist["forecast"][t] = y - err
+            hist["level"][t] = level
+            hist["trend"][t] = trend
+            hist["season"][t] = s
+    out = {
+        "level_last": np.array([[level]]), "trend_last": np.array([[trend]]),
+        "season_next": np.array([season[(n + j) % m] for j in range(m)]).reshape(1, 1, m),
+        "sse": np.array([[sse]]),
+    }
+    if keep_states:
+        out.update({k: np.array(v).reshape(1, 1, n) for k, v in hist.items()})
+    return out
+
+
+def hw_sse(Y, season_length, alpha, beta, gamma, seasonal="additive"):
+    """SSE one-step untuk setiap kombinasi parameter (array 1-D yang sama panjang).
+
+    Y 1-D -> array (G,); Y 2-D (S, n) -> array (S, G). Tanpa menyimpan state per waktu.
+    """
+    Y2, m = _check(Y, season_length, seasonal)
+    params = [np.atleast_1d(np.asarray(p, dtype=float))[None, :] for p in (alpha, beta, gamma)]
+    sse = _recurse(Y2, m, seasonal, *params, keep_states=False)["sse"]
+    return sse[0] if np.ndim(Y) == 1 else sse
+
+
+def hw_grid_search(Y, season_length, seasonal="additive", alphas=ALPHA_GRID, betas=BETA_GRID,
+                   gammas=GAMMA_GRID, chunk=2048):
+    """Cari (α, β, γ) dengan SSE one-step terkecil; semua kandidat dievaluasi sebagai satu batch.
+
+    Kandidat diproses per `chunk` kolom agar memori tetap terbatas untuk banyak series.
+    Y 1-D -> dict skalar; Y 2-D (S, n) -> dict array (S,) (parameter terbaik per series).
+    """
+    A, B, G = (g.ravel() for g in np.meshgrid(alphas, betas, gammas, indexing="ij"))
+    Y2, m = _check(Y, season_length, seasonal)
+    sse = np.concatenate([
+        _recurse(Y2, m, seasonal, A[None, i:i + chunk], B[None, i:i + chunk], G[None, i:i + chunk],
+                 keep_states=False)["sse"]
+        for i in range(0, len(A), chunk)
+    ], axis=1)
+    sse = np.where(np.isfinite(sse), sse, np.inf)
+    best = np.argmin(sse, axis=1)
+    out = {"alpha": A[best], "beta": B[best], "gamma": G[best], "sse": sse[np.arange(len(best)), best],
+           "n_candidates": len(A)}
+    if np.ndim(Y) == 1:
+        out.update({k: float(out[k][0]) for k in ("alpha", "beta", "gamma", "sse")})
+    return out
+
+
+def hw_smooth(Y, season_length, alpha, beta, gamma, seasonal="additive"):
+    """Level, trend, musiman dan forecast in-sample (one-step) per waktu.
+
+    Forecast musim pertama = NaN: indeks musimannya diinisialisasi dari observasi
+    yang sama, jadi (seperti SSE grid search) evaluasi dimulai dari t = m.
+    Y 1-D -> array (n,); Y 2-D (S, n) dengan parameter skalar atau (S,) -> array (S, n).
+    """
+    Y2, m = _check(Y, season_length, seasonal)
+    params = [np.asarray(p, dtype=float).reshape(-1, 1) if np.ndim(p) else float(p) for p in (alpha, beta, gamma)]
+    res = _recurse(Y2, m, seasonal, *params, keep_states=True)
+    out = {k: v[:, 0] for k, v in res.items() if k != "season_next"}
+    out["season_next"] = res["season_next"][:, 0]
+    out["forecast"][:, :m] = np.nan
+    if np.ndim(Y) == 1:
+        out = {k: (v[0] if isinstance(v, np.ndarray) and v.ndim > 1 else float(v[0])) for k, v in out.items()}
+    out.update({"alpha": alpha, "beta": beta, "gamma": gamma, "season_length": m, "seasonal": seasonal})
+    return out
+
+
+def hw_forecast(model, periods_ahead):
+    """Forecast h = 1..periods_ahead dari hasil `hw_smooth` (ikut bentuk batch-nya)."""
+    h = np.arange(1, periods_ahead + 1)
+    level = np.asarray(model["level_last"], dtype=float)[..., None]
+    trend = np.asarray(model["trend_last"], dtype=float)[..., None]
+    seas = np.asarray(model["season_next"], dtype=float)[..., (h - 1) % model["season_length"]]
+    if model["seasonal"] == "additive":
+        return level + h * trend + seas
+    return (level + h * trend) * seas
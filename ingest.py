@@ -0,0 +1,150 @@
+import argparse
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# ====================== BULK INGESTION ======================
+# Membaca banyak workbook XLSX (semua sheet) / CSV secara paralel di process pool
+# (parsing openpyxl terikat CPU), memvalidasi kolom, lalu menggabungkan semuanya
+# menjadi satu panel bertipe dengan kolom `source` dan `sheet`. `source` = path
+# file relatif terhadap direktori induk bersama semua input, sehingga workbook
+# bernama sama di direktori berbeda (data/ZA/dataset.xlsx, data/BR/dataset.xlsx)
+# tetap menjadi series terpisah.
+# Contoh CLI: python ingest.py "data/*.xlsx" data_csv/ --out panel.parquet --workers 8
+
+REQUIRED_COLUMNS = ('Year', 'gini_disp')
+EXPECTED_COLUMNS = ('gini_mkt', 'Inflation rate', 'GDP', 'GOVEDU', 'GOVEXP', 'FINDEV 1', 'DEMOCRACY', 'FLABOUR')
+EXTENSIONS = ('.xlsx', '.xls', '.csv')
+
+
+def discover(inputs):
+    """Expand direktori, glob, dan path file menjadi daftar file yang didukung (urut, unik)."""
+    files = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(item, f) for f in os.listdir(item)]
+        else:
+            candidates = glob.glob(item)
+        files.update(os.path.abspath(p) for p in candidates
+                     if p.lower().endswith(EXTENSIONS) and not os.path.basename(p).startswith("~$"))
+    return sorted(files)
+
+
+def source_keys(files):
+    """{path absolut: key source}; key = path relatif terhadap direktori induk bersama."""
+    if not files:
+        return {}
+    root = os.path.commonpath([os.path.dirname(f) for f in files])
+    return {f: os.path.relpath(f, root) for f in files}
+
+
+def validate_frame(df, required=REQUIRED_COLUMNS):
+    """Kembalikan (frame bertipe, daftar masalah). Frame None jika tidak bisa dipakai."""
+    df = df.rename(columns=lambda c: str(c).strip())
+    missing = [c for c in required if c not in df.columns]
+    if missing:
+        return None, [f"kolom wajib tidak ada: {missing}"]
+    problems = []
+    absent = [c for c in EXPECTED_COLUMNS if c not in df.columns]
+    if absent:
+        problems.append(f"kolom opsional tidak ada: {absent}")
+
+    out = pd.DataFrame(index=df.index)
+    year = pd.to_numeric(df['Year'], errors='coerce')
+    bad_year = year.isna() | (year != np.floor(year))
+    if bad_year.any():
+        problems.append(f"{int(bad_year.sum())} baris dengan Year tidak valid dibuang")
+    out['Year'] = year
+    for col in df.columns:
+        if col == 'Year':
+            continue
+        values = pd.to_numeric(df[col], errors='coerce')
+        coerced = values.isna() & df[col].notna()
+        if coerced.any():
+            problems.append(f"{int(coerced.sum())} nilai non-numerik di '{col}' diganti NaN")
+        out[col] = values.astype('float64')
+    out = out[~bad_year]
+    out['Year'] = out['Year'].astype('int64')
+    if out['Year'].duplicated().any():
+        problems.append("Year duplikat")
+    return out.sort_values('Year').reset_index(drop=True), problems
+
+
+def read_workbook(path):
+    """Dict {nama_sheet: DataFrame} untuk XLSX (semua sheet) atau CSV (sheet '')."""
+    if path.lower().endswith('.csv'):
+        return {"": pd.read_csv(path)}
+    return pd.read_excel(path, sheet_name=None)
+
+
+def read_file(path):
+    """Baca + validasi satu file; dijalankan di worker process. Kolom `source` berisi `path`."""
+    frames, issues = [], []
+    try:
+        sheets = read_workbook(path)
+    except Exception as e:
+        return frames, [{"source": path, "sheet": None, "problem": f"gagal dibaca: {type(e).__name__}: {e}"}]
+    for sheet, df in sheets.items():
+        typed, problems = validate_frame(df)
+        issues.extend({"source": path, "sheet": sheet, "problem": p} for p in problems)
+        if typed is not None and len(typed):
+            typed.insert(0, 'sheet', sheet)
+            typed.insert(0, 'source', path)
+            frames.append(typed)
+    return frames, issues
+
+
+def ingest(inputs, workers=None, strict=False):
+    """Baca semua file secara paralel; kembalikan (panel DataFrame, DataFrame masalah validasi)."""
+    files = discover(inputs)
+    if not files:
+        raise ValueError(f"Tidak ada file {EXTENSIONS} ditemukan di {inputs}")
+    n_workers = min(len(files), workers or os.cpu_count() or 1)
+    if n_workers == 1:
+        results = [read_file(f) for f in files]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(read_file, files, chunksize=max(1, len(files) // (4 * n_workers))))
+
+    keys = source_keys(files)
+    frames = [f for fs, _ in results for f in fs]
+    issues = pd.DataFrame([i for _, iss in results for i in iss], columns=["source", "sheet", "problem"])
+    issues['source'] = issues['source'].map(keys)
+    if strict and len(issues):
+        raise ValueError(f"Validasi gagal untuk {issues['source'].nunique()} file:\n{issues.to_string(index=False)}")
+    if not frames:
+        raise ValueError("Tidak ada sheet yang lolos validasi")
+
+    panel = pd.concat(frames, ignore_index=True, sort=False)
+    panel['source'] = panel['source'].map(keys).astype('category')
+    panel['sheet'] = panel['sheet'].astype('category')
+    # Kolom numerik yang tidak ada di sebagian file terisi NaN -> tetap float64
+    value_cols = [c for c in panel.columns if c not in ('source', 'sheet', 'Year')]
+    panel[value_cols] = panel[value_cols].astype('float64')
+    return panel, issues
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest banyak workbook/CSV menjadi satu panel")
+    parser.add_argument("inputs", nargs="+", help="Direktori, glob, atau file XLSX/CSV")
+    parser.add_argument("--out", required=True, help="File output (.parquet atau .csv)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--strict", action="store_true", help="Gagal jika ada masalah validasi")
+    args = parser.parse_args(argv)
+
+    panel, issues = ingest(args.inputs, args.workers, args.strict)
+    if args.out.endswith(".csv"):
+        panel.to_csv(args.out, index=False)
+    else:
+        panel.to_parquet(args.out, index=False)
+    print(f"{len(panel)} baris dari {panel['source'].nunique()} file ditulis ke {args.out}")
+    if len(issues):
+        print(f"{len(issues)} catatan validasi:")
+        print(issues.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from des import prepare_series, des_fit
+from ingest import read_workbook
+from metrics import compute_metrics
+
+# ====================== SHARDED JOB RUNNER ======================
+# Queue berbasis file di filesystem bersama:
+#   <queue>/config.json        parameter run (alpha, periods, kolom)
+#   <queue>/pending/*.json     shard yang belum dikerjakan (daftar file input); nama
+#                              shard = hash isi daftar file, init ulang hanya membuat
+#                              shard untuk file yang belum masuk shard mana pun
+#   <queue>/running/*.json     shard yang sedang diklaim worker (rename atomik);
+#                              mtime = heartbeat lease, diperbarui setiap file selesai
+#   <queue>/done/*.json        checkpoint shard selesai
+#   <queue>/results/*.parquet  hasil per shard (kolom `source` = path absolut file, unik
+#                              walau nama workbook sama di direktori berbeda)
+# Worker di host lain cukup menjalankan `work` dengan direktori queue yang sama.
+#
+# Contoh:
+#   python jobrunner.py init --inputs "data/*.xlsx" --queue jobs --shard-size 20
+#   python jobrunner.py work --queue jobs --workers 8
+#   python jobrunner.py consolidate --queue jobs --output hasil.parquet
+#   (consolidate menolak jika masih ada shard pending/running, kecuali --allow-partial)
+
+_DIRS = ("pending", "running", "done", "results")
+
+
+def _atomic_write_json(path, obj):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(obj, f)
+    os.replace(tmp, path)
+
+
+def init_queue(queue_dir, inputs, shard_size=20, alpha=0.6, periods_ahead=5, cols=("gini_disp",)):
+    """Bagi file input menjadi shard. Shard yang sudah ada (mis. run terputus) tidak dibuat ulang."""
+    for d in _DIRS:
+        os.makedirs(os.path.join(queue_dir, d), exist_ok=True)
+    files = sorted({os.path.abspath(p) for pattern in inputs for p in glob.glob(pattern)})
+    config = {"alpha": alpha, "periods_ahead": periods_ahead, "cols": list(cols)}
+    config_path = os.path.join(queue_dir, "config.json")
+    if os.path.exists(config_path):
+        with open(config_path) as f:
+            if json.load(f) != config:
+                raise ValueError("Queue sudah berisi run dengan parameter berbeda")
+    else:
+        _atomic_write_json(config_path, config)
+
+    # File baru (mis. workbook ditambahkan setelah init pertama) masuk shard baru;
+    # file yang sudah ada di shard lain tidak dibagi ulang
+    assigned = _assigned_files(queue_dir)
+    files = [f for f in files if f not in assigned]
+    created = 0
+    for i in range(0, len(files), shard_size):
+        chunk = files[i:i + shard_size]
+        name = f"shard-{hashlib.sha1(chr(0).join(chunk).encode()).hexdigest()[:16]}.json"
+        _atomic_write_json(os.path.join(queue_dir, "pending", name), {"files": chunk})
+        created += 1
+    return created
+
+
+def _assigned_files(queue_dir):
+    # Urutan pending -> running -> done mengikuti arah perpindahan shard, sehingga shard
+    # yang dipindah worker selama pemindaian tetap terbaca di direktori berikutnya
+    assigned = set()
+    for d in ("pending", "running", "done"):
+        for path in glob.glob(os.path.join(queue_dir, d, "*.json")):
+            try:
+                with open(path) as f:
+                    assigned.update(json.load(f)["files"])
+            except FileNotFoundError:
+                pass
+    return assigned
+
+
+def requeue_stale(queue_dir, lease_seconds=3600):
+    """Kembalikan shard `running` yang terlalu lama (worker mati) ke `pending`."""
+    now = time.time()
+    requeued = 0
+    for path in glob.glob(os.path.join(queue_dir, "running", "*.json")):
+        try:
+            if now - os.path.getmtime(path) < lease_seconds:
+                continue
+            shard = os.path.basename(path).split("@", 1)[0]
+            os.rename(path, os.path.join(queue_dir, "pending", shard + ".json"))
+            requeued += 1
+        except FileNotFoundError:
+            pass  # sudah diambil/diselesaikan worker lain
+    return requeued
+
+
+def renew_lease(running):
+    """Perbarui mtime shard running (heartbeat). False jika shard sudah di-requeue worker lain."""
+    try:
+        os.utime(running)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def claim_shard(queue_dir):
+    # os.rename atomik: hanya satu worker yang berhasil memindahkan shard ke running/
+    owner = f"{socket.gethostname()}.{os.getpid()}"
+    for path in sorted(glob.glob(os.path.join(queue_dir, "pending", "*.json"))):
+        shard = os.path.splitext(os.path.basename(path))[0]
+        running = os.path.join(queue_dir, "running", f"{shard}@{owner}.json")
+        try:
+            os.rename(path, running)
+        except FileNotFoundError:
+            continue
+        # rename mempertahankan mtime saat init; lease dihitung sejak klaim
+        if not renew_lease(running):
+            continue
+        return shard, running
+    return None, None
+
+
+def process_file(path, config):
+    """Forecast semua kolom target di setiap sheet workbook; satu baris per series."""
+    rows = []
+    for sheet, df in read_workbook(path).items():
+        for col in config["cols"]:
+            row = {"source": path, "sheet": sheet, "col": col,
+                   "alpha": config["alpha"], "status": "ok", "error": None}
+            try:
+                years, Y = prepare_series(df, col)
+                res = des_fit(Y, config["alpha"], config["periods_ahead"])
+                row.update(compute_metrics(Y, res["forecast"]))
+                row.update({
+                    "n_obs": len(Y), "last_year": int(years[-1]), "last_value": float(Y[-1]),
+                    "a": float(res["a"][-1]), "b": float(res["b"][-1]),
+                    "future_years": [int(years[-1]) + k + 1 for k in range(config["periods_ahead"])],
+                    "future_forecasts": res["future_forecasts"].tolist(),
+                })
+            except Exception as e:
+                row.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+            rows.append(row)
+    return rows
+
+
+def work(queue_dir):
+    """Loop worker: klaim shard, proses, tulis hasil, tandai done. Kembalikan jumlah shard."""
+    with open(os.path.join(queue_dir, "config.json")) as f:
+        config = json.load(f)
+    processed = 0
+    while True:
+        shard, running = claim_shard(queue_dir)
+        if shard is None:
+            return processed
+        try:
+            with open(running) as f:
+                files = json.load(f)["files"]
+        except FileNotFoundError:
+            continue  # lease habis sebelum sempat dibaca, shard diambil alih worker lain
+        rows, lost = [], False
+        for path in files:
+            try:
+                rows.extend(process_file(path, config))
+            except Exception as e:
+                rows.append({"source": path, "status": "error", "error": f"{type(e).__name__}: {e}"})
+            if not renew_lease(running):
+                lost = True  # lease habis dan shard sudah di-requeue: biarkan worker lain menyelesaikannya
+                break
+        if lost:
+            continue
+        out = os.path.join(queue_dir, "results", f"{shard}.parquet")
+        tmp = f"{out}.{os.getpid()}.tmp"
+        pd.DataFrame(rows).to_parquet(tmp, index=False)
+        os.replace(tmp, out)
+        try:
+            os.rename(running, os.path.join(queue_dir, "done", f"{shard}.json"))
+        except FileNotFoundError:
+            # Shard di-requeue di antara heartbeat terakhir dan rename; hasil (identik) sudah
+            # tertulis atomik dan worker yang mengambil alih akan menandainya done
+            continue
+        processed += 1
+
+
+def run_workers(queue_dir, workers=None, lease_seconds=3600):
+    requeue_stale(queue_dir, lease_seconds)
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(work, [queue_dir] * workers))
+
+
+def consolidate(queue_dir, output, allow_partial=False):
+    """Gabungkan hasil semua shard menjadi satu file Parquet.
+
+    Ditolak (ValueError) selama masih ada shard pending/running, mis. host yang mati
+    dan shard-nya belum di-requeue, kecuali `allow_partial`.
+    """
+    status = queue_status(queue_dir)
+    unfinished = status["pending"] + status["running"]
+    if unfinished and not allow_partial:
+        raise ValueError(f"{unfinished} shard belum selesai ({status}); jalankan `work` lagi "
+                         "(shard running yang lease-nya habis akan di-requeue) atau pakai --allow-partial")
+    parts = sorted(glob.glob(os.path.join(queue_dir, "results", "*.parquet")))
+    df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True) if parts else pd.DataFrame()
+    tmp = f"{output}.{os.getpid()}.tmp"
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, output)
+    return len(df)
+
+
+def queue_status(queue_dir):
+    return {d: len(glob.glob(os.path.join(queue_dir, d, "*.json"))) for d in ("pending", "running", "done")}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Job runner forecast multi-dataset berbasis shard")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_init = sub.add_parser("init", help="Buat shard dari file input")
+    p_init.add_argument("--inputs", nargs="+", required=True, help="Glob file XLSX/CSV")
+    p_init.add_argument("--shard-size", type=int, default=20)
+    p_init.add_argument("--alpha", type=float, default=0.6)
+    p_init.add_argument("--periods", type=int, default=5)
+    p_init.add_argument("--cols", nargs="+", default=["gini_disp"])
+
+    p_work = sub.add_parser("work", help="Jalankan worker pool di host ini")
+    p_work.add_argument("--workers", type=int, default=None)
+    p_work.add_argument("--lease", type=float, default=3600, help="Detik sebelum shard running dianggap mati")
+
+    p_cons = sub.add_parser("consolidate", help="Gabungkan hasil shard")
+    p_cons.add_argument("--output", required=True)
+    p_cons.add_argument("--allow-partial", action="store_true",
+                        help="Tetap gabungkan walau masih ada shard pending/running")
+
+    sub.add_parser("status", help="Tampilkan jumlah shard per status")
+
+    for p in (p_init, p_work, p_cons, sub.choices["status"]):
+        p.add_argument("--queue", required=True, help="Direktori queue (filesystem bersama)")
+    args = parser.parse_args(argv)
+
+    if args.command == "init":
+        n = init_queue(args.queue, args.inputs, args.shard_size, args.alpha, args.periods, args.cols)
+        print(f"{n} shard baru dibuat")
+    elif args.command == "work":
+        start = time.perf_counter()
+        n = run_workers(args.queue, args.workers, args.lease)
+        print(f"{n} shard diproses dalam {time.perf_counter() - start:.1f} s")
+    elif args.command == "consolidate":
+        status = queue_status(args.queue)
+        if args.allow_partial and status["pending"] + status["running"]:
+            print(f"PERINGATAN: hasil parsial, {status['pending']} shard pending dan "
+                  f"{status['running']} running belum ikut digabung", file=sys.stderr)
+        print(f"{consolidate(args.queue, args.output, args.allow_partial)} baris ditulis ke {args.output}")
+    print(queue_status(args.queue))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import multiprocessing
+import sys
+import threading
+import types
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+# ====================== BACKGROUND JOBS ======================
+# Pekerjaan berat (sweep alpha, backtest, bootstrap, multi-series) dijalankan di
+# pool milik proses, bukan di thread script Streamlit. `submit*` langsung
+# mengembalikan job id; halaman cukup menyimpan id di session_state dan membaca
+# progres/hasil dari JobManager pada setiap rerun.
+#
+#   submit(func, ...)          func(ctx, ...) di thread pool; progres & pembatalan
+#                              lewat ctx.progress(...) / ctx.cancelled (kooperatif)
+#   submit_map(func, items)    func(item) untuk setiap item di process/thread pool;
+#                              progres = jumlah item selesai, hasil = list terurut
+#
+# Timeout dan pembatalan menghentikan item yang belum mulai; item yang sedang
+# berjalan di process pool dibiarkan selesai tetapi hasilnya dibuang.
+#
+# Process pool memakai start method "spawn": server Streamlit multi-thread (warmer,
+# koneksi SQLite, state Tornado), dan fork dari proses seperti itu bisa membuat
+# proses anak deadlock pada lock yang sedang dipegang thread lain saat fork.
+#
+# Batasan spawn: proses anak biasanya meng-import ulang `__main__.__file__`, dan di
+# Streamlit `__main__` adalah main.py, sehingga setiap worker akan menjalankan
+# seluruh aplikasi (load data, SQLite, warmer, widget). Karena itu proses worker
+# dibuat dengan `__main__` sementara diganti modul kosong. Akibatnya fungsi yang
+# dikirim ke process pool harus berasal dari modul yang bisa di-import (mis.
+# des.des_backtest), bukan didefinisikan di main.py.
+
+PENDING, RUNNING, DONE, FAILED, CANCELLED, TIMEOUT = "pending", "running", "done", "failed", "cancelled", "timeout"
+FINAL_STATES = (DONE, FAILED, CANCELLED, TIMEOUT)
+
+
+_WORKER_MAIN = types.ModuleType("__main__")  # tanpa __file__: anak tidak menyiapkan script apa pun
+_spawn_lock = threading.Lock()
+
+
+class _WorkerProcess(multiprocessing.context.SpawnProcess):
+    @staticmethod
+    def _Popen(process_obj):
+        # Data persiapan anak (termasuk path __main__) dibaca dan dikirim di dalam Popen
+        with _spawn_lock:
+            main = sys.modules["__main__"]
+            sys.modules["__main__"] = _WORKER_MAIN
+            try:
+                return multiprocessing.context.SpawnProcess._Popen(process_obj)
+            finally:
+                sys.modules["__main__"] = main
+
+
+class _WorkerContext(multiprocessing.context.SpawnContext):
+    Process = _WorkerProcess
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, label, timeout):
+        self.id = uuid.uuid4().hex[:8]
+        self.label = label
+        self.timeout = timeout
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._cancel = threading.Event()
+
+    @property
+    def active(self):
+        return self.status not in FINAL_STATES
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def expired(self):
+        return self.timeout is not None and self.started is not None and time.time() - self.started > self.timeout
+
+    def _finish(self, status, result=None, error=None):
+        self.status, self.result, self.error = status, result, error
+        self.finished = time.time()
+
+
+class JobContext:
+    """Diteruskan ke fungsi `submit` untuk melaporkan progres dan memeriksa pembatalan."""
+
+    def __init__(self, job):
+        self._job = job
+
+    def progress(self, done, total=None, message=None):
+        self._job.progress = min(1.0, done / total) if total else float(done)
+        if message is not None:
+            self._job.message = message
+
+    @property
+    def cancelled(self):
+        return self._job._cancel.is_set() or self._job.expired()
+
+    def check(self):
+        # Panggil di titik aman dalam loop panjang
+        if self.cancelled:
+            raise JobCancelled()
+
+
+class JobManager:
+    """Pool job per proses (dipakai bersama oleh semua sesi)."""
+
+    def __init__(self, thread_workers=2, process_workers=None, keep=50):
+        self.keep = keep
+        self._threads = ThreadPoolExecutor(max_workers=thread_workers, thread_name_prefix="job")
+        self._process_workers = process_workers
+        self._processes = None
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def _process_pool(self):
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self._process_workers, mp_context=_WorkerContext())
+            return self._processes
+
+    def _register(self, job):
+        with self._lock:
+            self._jobs[job.id] = job
+            # Buang job selesai yang paling lama bila riwayat terlalu panjang
+            finished = sorted((j for j in self._jobs.values() if not j.active), key=lambda j: j.created)
+            for old in finished[:max(0, len(self._jobs) - self.keep)]:
+                del self._jobs[old.id]
+        return job.id
+
+    def submit(self, func, *args, label="", timeout=None, **kwargs):
+        """Jalankan func(ctx, *args, **kwargs) di thread pool; kembalikan job id."""
+        job = Job(label or getattr(func, "__name__", "job"), timeout)
+
+        def run():
+            if job._cancel.is_set():
+                job._finish(CANCELLED)
+                return
+            job.status, job.started = RUNNING, time.time()
+            ctx = JobContext(job)
+            try:
+                result = func(ctx, *args, **kwargs)
+            except JobCancelled:
+                job._finish(TIMEOUT if job.expired() and not job._cancel.is_set() else CANCELLED)
+            except Exception as e:
+                job._finish(FAILED, error=f"{type(e).__name__}: {e}")
+            else:
+                job.progress = 1.0
+                job._finish(DONE, result)
+
+        self._register(job)
+        self._threads.submit(run)
+        return job.id
+
+    def submit_map(self, func, items, label="", timeout=None, kind="process", reduce=None):
+        """Jalankan func(item) untuk setiap item; hasil = list terurut (atau reduce(list))."""
+        if kind not in ("process", "thread"):
+            raise ValueError(f"kind harus 'process' atau 'thread', bukan {kind}")
+        items = list(items)
+        job = Job(label or getattr(func, "__name__", "job"), timeout)
+        job.message = f"0/{len(items)} selesai"
+        self._register(job)
+        threading.Thread(target=self._collect, args=(job, func, items, kind, reduce),
+                         name=f"job-{job.id}", daemon=True).start()
+        return job.id
+
+    def _collect(self, job, func, items, kind, reduce):
+        if job._cancel.is_set():
+            return
+        pool = self._process_pool() if kind == "process" else self._threads
+        job.status, job.started = RUNNING, time.time()
+        pending = set()
+        try:
+            futures = {pool.submit(func, item): i for i, item in enumerate(items)}
+            results = [None] * len(items)
+            pending = set(futures)
+            while pending:
+                if job._cancel.is_set() or job.expired():
+                    for f in pending:
+                        f.cancel()
+                    job._finish(CANCELLED if job._cancel.is_set() else TIMEOUT)
+                    return
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for f in done:
+                    results[futures[f]] = f.result()
+                n_done = len(items) - len(pending)
+                job.progress = n_done / len(items) if items else 1.0
+                job.message = f"{n_done}/{len(items)} selesai"
+            job._finish(DONE, reduce(results) if reduce else results)
+        except Exception as e:
+            for f in pending:
+                f.cancel()
+            if isinstance(e, BrokenProcessPool):
+                # Worker mati (mis. OOM): pool dibuat ulang untuk job berikutnya
+                with self._lock:
+                    self._processes = None
+            job._finish(FAILED, error=f"{type(e).__name__}: {e}")
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None and job.active:
+            job._cancel.set()
+            if job.status == PENDING:
+                job._finish(CANCELLED)
+
+    def jobs(self, ids=None):
+        with self._lock:
+            selected = self._jobs.values() if ids is None else (self._jobs[i] for i in ids if i in self._jobs)
+            return sorted(selected, key=lambda j: j.created, reverse=True)
+
+    def stats(self):
+        counts = {}
+        for job in self.jobs():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+    def shutdown(self):
+        for job in self.jobs():
+            self.cancel(job.id)
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
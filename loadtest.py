@@ -0,0 +1,192 @@
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest
+
+# ====================== LOAD TEST HARNESS ======================
+# Mensimulasikan N sesi bersamaan yang berpindah menu, mengubah alpha /
+# periode prediksi, dan menekan tombol hitung pada halaman Modeling & Evaluation.
+# Contoh: python loadtest.py --sessions 8 --iterations 20
+#
+# Rerun yang gagal (exception di app, timeout, widget tidak ditemukan) dihitung
+# sebagai error dan tidak masuk sampel latency. Pada mode thread, kompilasi
+# script diserialkan: setiap AppTest punya ScriptCache sendiri dan compile()
+# paralel di satu interpreter bisa gagal di Python 3.11 ("AST constructor
+# recursion depth mismatch").
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+
+PAGES = {
+    "🤖 Modeling": "🔥 Hitung Forecast",
+    "✅ Evaluation": "📊 Evaluasi Model",
+}
+
+
+_COMPILE_LOCK = threading.Lock()
+
+
+def _serialize_compilation():
+    original = ScriptCache.get_bytecode
+    if getattr(original, "serialized", False):
+        return
+
+    def get_bytecode(self, script_path):
+        with _COMPILE_LOCK:
+            return original(self, script_path)
+
+    get_bytecode.serialized = True
+    ScriptCache.get_bytecode = get_bytecode
+
+
+def _step(result, label, action):
+    """Jalankan satu rerun; latency hanya dicatat jika rerun selesai tanpa exception."""
+    start = time.perf_counter()
+    try:
+        app = action()
+    except Exception as e:
+        result["errors"].append((label, f"{type(e).__name__}: {e}"))
+        return False
+    elapsed = time.perf_counter() - start
+    if len(app.exception):
+        result["errors"].append((label, str(app.exception[0].value)))
+        return False
+    result["latencies"].append((label, elapsed))
+    return True
+
+
+def _sidebar_widget(widgets, label):
+    widget = next((w for w in widgets if w.label == label), None)
+    if widget is None:
+        raise LookupError(f"widget '{label}' tidak ditemukan")
+    return widget
+
+
+def run_session(session_id, iterations, seed, timeout):
+    """Satu sesi pengguna; mengembalikan dict latencies [(aksi, detik)], errors [(aksi, pesan)], pid, rss."""
+    rng = random.Random(seed + session_id)
+    result = {"latencies": [], "errors": []}
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    if _step(result, "initial", at.run):
+        for _ in range(iterations):
+            page = rng.choice(list(PAGES))
+            alpha = round(rng.uniform(0.01, 0.99), 2)
+            periods = rng.randint(1, 20)
+            steps = [
+                ("navigate", lambda: at.sidebar.radio[0].set_value(page).run()),
+                ("alpha", lambda: _sidebar_widget(at.sidebar.slider, "Alpha (α)").set_value(alpha).run()),
+                ("periods_ahead", lambda: _sidebar_widget(at.sidebar.number_input, "Periode Prediksi").set_value(periods).run()),
+                ("compute", lambda: _sidebar_widget(at.sidebar.button, PAGES[page]).click().run()),
+            ]
+            for label, action in steps:
+                # Langkah berikutnya butuh halaman dari langkah ini: berhenti di langkah yang gagal
+                if not _step(result, label, action):
+                    break
+    result["pid"] = os.getpid()
+    result["rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def _rss_mb(kb_or_bytes):
+    # Linux melaporkan KB, macOS melaporkan byte
+    return kb_or_bytes / 1024 ** 2 if sys.platform == "darwin" else kb_or_bytes / 1024
+
+
+def _percentiles(values):
+    if not len(values):
+        return {"p50": float("nan"), "p95": float("nan"), "p99": float("nan")}
+    return {f"p{q}": float(np.percentile(values, q)) for q in (50, 95, 99)}
+
+
+def summarize(results, wall_time, mode):
+    latencies = [x for r in results for x in r["latencies"]]
+    errors = [x for r in results for x in r["errors"]]
+    values = np.array([lat for _, lat in latencies])
+    by_action = {}
+    for action in sorted({a for a, _ in latencies} | {a for a, _ in errors}):
+        v = np.array([lat for a, lat in latencies if a == action])
+        by_action[action] = {"count": len(v), "errors": sum(1 for a, _ in errors if a == action), **_percentiles(v)}
+    if mode == "process":
+        # ru_maxrss anak = puncak satu proses; total = jumlah puncak setiap proses worker
+        per_pid = {}
+        for r in results:
+            per_pid[r["pid"]] = max(per_pid.get(r["pid"], 0), r["rss"])
+        peak_rss, rss_scope = sum(per_pid.values()), f"jumlah puncak {len(per_pid)} proses"
+    else:
+        peak_rss, rss_scope = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, "satu proses"
+    attempts = len(values) + len(errors)
+    pct = _percentiles(values)
+    return {
+        "reruns": len(values),
+        "errors": len(errors),
+        "error_rate": len(errors) / attempts if attempts else 0.0,
+        "error_samples": [f"{a}: {msg}" for a, msg in errors[:5]],
+        "wall_time_s": wall_time,
+        "throughput_rps": len(values) / wall_time if wall_time else 0.0,
+        "p50_s": pct["p50"],
+        "p95_s": pct["p95"],
+        "p99_s": pct["p99"],
+        "peak_rss_mb": _rss_mb(peak_rss),
+        "peak_rss_scope": rss_scope,
+        "by_action": by_action,
+    }
+
+
+def run_load_test(sessions, iterations, mode="thread", seed=0, timeout=120):
+    if mode == "thread":
+        _serialize_compilation()
+    executor_cls = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+    start = time.perf_counter()
+    with executor_cls(max_workers=sessions) as pool:
+        futures = [pool.submit(run_session, i, iterations, seed, timeout) for i in range(sessions)]
+        results = [f.result() for f in futures]
+    return summarize(results, time.perf_counter() - start, mode)
+
+
+def print_report(report, sessions, iterations, mode):
+    print(f"Sesi: {sessions} ({mode}) | Iterasi per sesi: {iterations}")
+    print(f"Total rerun     : {report['reruns']} berhasil, {report['errors']} gagal "
+          f"(error rate {report['error_rate'] * 100:.1f}%)")
+    print(f"Waktu total     : {report['wall_time_s']:.2f} s")
+    print(f"Throughput      : {report['throughput_rps']:.2f} rerun/s")
+    print(f"Latency p50/p95/p99 : {report['p50_s'] * 1000:.0f} / {report['p95_s'] * 1000:.0f} / {report['p99_s'] * 1000:.0f} ms")
+    print(f"Peak RSS        : {report['peak_rss_mb']:.1f} MB ({report['peak_rss_scope']})")
+    print()
+    print(f"{'Aksi':<15}{'n':>6}{'error':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for action, s in report["by_action"].items():
+        print(f"{action:<15}{s['count']:>6}{s['errors']:>7}{s['p50'] * 1000:>10.0f}{s['p95'] * 1000:>10.0f}{s['p99'] * 1000:>10.0f}")
+    if report["error_samples"]:
+        print()
+        print("Contoh error:")
+        for msg in report["error_samples"]:
+            print(f"  {msg}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test sesi bersamaan untuk aplikasi Streamlit")
+    parser.add_argument("--sessions", type=int, default=4, help="Jumlah sesi bersamaan")
+    parser.add_argument("--iterations", type=int, default=10, help="Jumlah siklus klik per sesi")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread",
+                        help="thread = satu instance bersama (seperti server), process = instance terpisah")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120, help="Timeout per rerun (detik)")
+    parser.add_argument("--json", dest="json_path", help="Simpan laporan sebagai JSON")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(args.sessions, args.iterations, args.mode, args.seed, args.timeout)
+    print_report(report, args.sessions, args.iterations, args.mode)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"sessions": args.sessions, "iterations": args.iterations, "mode": args.mode, **report}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
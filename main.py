@@ -1,8 +1,24 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import os
+import json
+import uuid
+from functools import partial
+
+from downsample import DOWNSAMPLE_METHODS
+from charts import CHART_BACKENDS, line_chart, box_chart, fan_chart
+from des import mape_category, des_backtest
+from shared_cache import get_cache
+from warmer import CacheWarmer, neighbor_params
+from report import build_report
+from scenario import estimate_driver_effect, scenario_shifts, simulate_paths, summarize_paths
+from pipeline import build_forecast_pipeline
+from shared_data import enable_copy_on_write
+from resample import PERIOD_NAMES, PERIODS_PER_YEAR
+from holtwinters import SEASONAL_TYPES
+from jobs import JobManager
+from drivers import DRIVER_COLUMNS, CRITERIA, describe_lags
 
 # ====================== PAGE CONFIG & STYLE ======================
 st.set_page_config(page_title="Income Inequality Forecast - CRISP-DM", layout="wide")
@@ -81,16 +97,196 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # ====================== LOAD DATA ======================
-@st.cache_data
-def load_data():
+# Output stage disimpan sekali per proses sebagai objek read-only (dipakai bersama semua sesi
+# tanpa salinan) dan di shared_cache = cache bersama antar worker di host yang sama
+enable_copy_on_write()
+shared_cache = get_cache()
+
+@st.cache_resource
+def get_pipeline():
+    # Satu pipeline per proses; output stage disimpan di shared cache berdasarkan hash isi input
+    return build_forecast_pipeline(shared_cache)
+
+pipeline = get_pipeline()
+
+# Dataset default = workbook tahunan bawaan. Sumber bertanggal (kolom Date, mis. bulanan/kuartalan)
+# bisa dipakai lewat GINI_DATASET dan diagregasi ke GINI_FREQ (Y/Q/M) dengan GINI_AGG (mean/last/sum/...)
+DATA_FREQ = os.environ.get("GINI_FREQ", "Y")
+DATA_AGG = os.environ.get("GINI_AGG", "mean")
+PERIOD_NAME = PERIOD_NAMES[DATA_FREQ]
+
+def dataset_params():
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(script_dir, "Income Inequality in South Africa_Dataset.xlsx")
-    df = pd.read_excel(file_path)
-    df = df.sort_values(by='Year')
-    return df
+    file_path = os.environ.get("GINI_DATASET") or os.path.join(script_dir, "Income Inequality in South Africa_Dataset.xlsx")
+    return {"path": file_path, "mtime": os.path.getmtime(file_path), "freq": DATA_FREQ, "how": DATA_AGG}
+
+def load_data():
+    return pipeline.run(dataset_params(), ["resample"])["resample"]
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_report(dataset, alpha, periods_ahead):
+    # Laporan HTML hanya dibangun saat diminta; key = (file + mtime + frekuensi, alpha, horizon)
+    return build_report(load_data(), 'gini_disp', alpha, periods_ahead, title="South Africa", freq=dataset["freq"])
+
+def forecast_params(alpha, periods_ahead, col='gini_disp'):
+    return {**dataset_params(), "col": col, "alpha": alpha, "periods_ahead": periods_ahead}
+
+def warm_forecast(alpha, periods_ahead):
+    return pipeline.run(forecast_params(alpha, periods_ahead), ["forecast", "evaluate"])
+
+warm_forecast.cache_key = lambda alpha, periods_ahead: pipeline.key_for("forecast", forecast_params(alpha, periods_ahead))
+
+@st.cache_resource
+def get_warmer():
+    # Satu warmer per proses, dipakai bersama oleh semua sesi (putaran warming dicatat per sesi)
+    return CacheWarmer(warm_forecast, shared_cache, max_workers=1, time_budget=2.0)
+
+warmer = get_warmer()
+
+def warm_session():
+    # Id sesi untuk warmer: schedule() sesi ini tidak membatalkan warming milik sesi lain
+    return st.session_state.setdefault("warm_session", uuid.uuid4().hex)
+
+@st.cache_resource
+def get_job_manager():
+    # Pool job per proses; job id disimpan di session_state sehingga hasil tetap ada setelah rerun
+    return JobManager(thread_workers=2)
+
+job_manager = get_job_manager()
+
+JOB_ICONS = {"pending": "🕒", "running": "⏳", "done": "✅", "failed": "❌", "cancelled": "⛔", "timeout": "⌛"}
+
+def track_job(key, job_id):
+    st.session_state.setdefault("job_ids", []).append(job_id)
+    st.session_state[key] = job_id
+
+@st.fragment(run_every=0.5)
+def job_progress(job_id):
+    # Hanya fragment ini yang di-rerun selama job berjalan; halaman lain tetap responsif
+    job = job_manager.get(job_id)
+    if job is None or not job.active:
+        st.rerun()
+    with st.status(f"{JOB_ICONS[job.status]} {job.label}", state="running", expanded=True):
+        st.progress(job.progress, text=f"{job.message} · {job.elapsed:.1f} s")
+        if st.button("⛔ Batalkan", key=f"cancel_{job_id}"):
+            job_manager.cancel(job_id)
+            st.rerun()
+
+ALPHA_SWEEP = np.round(np.arange(0.01, 1.0, 0.01), 2)
+
+def show_sweep_result(results):
+    sweep = pd.DataFrame([{"α": r["alpha"], "MAE": r["MAE"], "RMSE": r["RMSE"], "MAPE (%)": r["MAPE"]} for r in results])
+    best = sweep.loc[sweep["MAPE (%)"].idxmin()]
+    st.success(f"🏆 α terbaik (MAPE backtest terendah): **{best['α']:.2f}** dengan MAPE {best['MAPE (%)']:.2f}%")
+    show_chart(line_chart(
+        [{'x': sweep["α"], 'y': sweep["MAPE (%)"], 'label': 'MAPE Backtest', 'color': '#00D1FF'}],
+        "MAPE Backtest Rolling-Origin vs α", "Alpha (α)", "MAPE (%)",
+        backend=chart_backend, max_points=chart_max_points, method=chart_downsample_method, legend=False
+    ))
+
+def show_job(job_id, render_result):
+    job = job_manager.get(job_id) if job_id else None
+    if job is None:
+        return
+    if job.active:
+        job_progress(job_id)
+        return
+    state = "complete" if job.status == "done" else "error"
+    with st.status(f"{JOB_ICONS[job.status]} {job.label} ({job.elapsed:.1f} s)", state=state, expanded=False):
+        st.text(job.error or job.message or job.status)
+    if job.status == "done":
+        render_result(job.result)
+
+# Cabang pipeline per model; output tetap dibaca lewat nama "model", "forecast", dst.
+MODEL_STAGES = {
+    "hw": {"model": "hw_model", "forecast": "hw_forecast", "evaluate": "hw_evaluate", "render": "hw_render"},
+    "reg": {"model": "reg_model", "forecast": "reg_forecast", "evaluate": "reg_evaluate", "render": "reg_render"},
+}
+MODEL_EXTRA_TARGETS = {"hw": [], "reg": ["reg_search"]}
+MODEL_NAMES = {"hw": "Holt-Winters", "reg": "Regresi driver"}
+
+def run_pipeline(alpha, periods_ahead, targets=("select", "model", "forecast", "evaluate", "render"), spec=None):
+    # Jalankan stage yang inputnya berubah, lalu hangatkan cache untuk alpha/horizon di sekitarnya.
+    # spec = model selain DES (dict dengan kunci "model" + parameternya), None = DES
+    params = {
+        **forecast_params(alpha, periods_ahead),
+        "chart_backend": chart_backend, "chart_max_points": chart_max_points, "chart_method": chart_downsample_method,
+    }
+    if spec is None:
+        warmer.note_request(alpha, periods_ahead)
+        result = pipeline.run(params, targets)
+        warmer.schedule(neighbor_params(alpha, periods_ahead), session=warm_session())
+        return result
+    stages = MODEL_STAGES[spec["model"]]
+    try:
+        result = pipeline.run({**params, **spec},
+                              [stages.get(t, t) for t in targets] + MODEL_EXTRA_TARGETS[spec["model"]])
+    except ValueError as e:
+        # Mis. data kurang dari 2 musim, musiman multiplicative pada data non-positif, sampel driver terlalu pendek
+        st.error(f"❌ {MODEL_NAMES[spec['model']]} tidak bisa dijalankan: {e}")
+        st.stop()
+    for name, stage_name in stages.items():
+        if stage_name in result.outputs:
+            result.outputs[name] = result.outputs[stage_name]
+    return result
+
+def model_sidebar(alpha_key=None):
+    # Pilihan model + parameternya; kembalikan (alpha, spec) dengan spec = None untuk DES
+    prefix = alpha_key or "model"
+    model_type = st.selectbox(
+        "Model", ["des", "hw", "reg"], key=f"{prefix}_type",
+        format_func=lambda m: {"des": "Double Exponential Smoothing (Brown)", "hw": "Holt-Winters (musiman)",
+                               "reg": "Regresi Driver + DES Error"}[m]
+    )
+    if model_type == "des":
+        return round(st.slider("Alpha (α)", min_value=0.01, max_value=0.99, value=0.60, step=0.01, key=alpha_key), 2), None
+    if model_type == "reg":
+        available = [c for c in DRIVER_COLUMNS if c in df_raw.columns]
+        spec = {
+            "model": "reg",
+            "drivers": tuple(st.multiselect("Kandidat Driver", available, default=available, key=f"{prefix}_drivers")),
+            "max_lag": st.slider("Lag Maksimum", min_value=0, max_value=3, value=2, key=f"{prefix}_maxlag",
+                                 help="Setiap driver dicoba tanpa dipakai atau dengan lag 0..maks"),
+            "criterion": st.selectbox("Kriteria Seleksi", CRITERIA, key=f"{prefix}_criterion"),
+        }
+        alpha = round(st.slider("Alpha (α) residual", min_value=0.01, max_value=0.99, value=0.60, step=0.01,
+                                key=f"{prefix}_reg_alpha"), 2)
+        return alpha, spec
+    seasonal = st.selectbox("Jenis Musiman", SEASONAL_TYPES, key=f"{prefix}_seasonal")
+    season_length = st.number_input(
+        "Panjang Musim (m)", min_value=2, max_value=52, value=max(PERIODS_PER_YEAR[DATA_FREQ], 4),
+        key=f"{prefix}_season", help="Jumlah periode dalam satu siklus musiman (4 = kuartalan, 12 = bulanan)"
+    )
+    optimize = st.checkbox("Optimasi α, β, γ (grid search)", value=True, key=f"{prefix}_optimize")
+    spec = {"model": "hw", "seasonal": seasonal, "season_length": int(season_length), "hw_optimize": optimize,
+            "hw_alpha": None, "hw_beta": None, "hw_gamma": None}
+    if not optimize:
+        spec["hw_alpha"] = round(st.slider("Alpha (α) - level", 0.01, 0.99, 0.30, 0.01, key=f"{prefix}_hwa"), 2)
+        spec["hw_beta"] = round(st.slider("Beta (β) - trend", 0.01, 0.99, 0.10, 0.01, key=f"{prefix}_hwb"), 2)
+        spec["hw_gamma"] = round(st.slider("Gamma (γ) - musiman", 0.01, 0.99, 0.20, 0.01, key=f"{prefix}_hwg"), 2)
+    return None, spec
+
+def show_pipeline_report(result):
+    with st.expander("⏱️ Pipeline: status cache & waktu per stage"):
+        st.dataframe(result.report_frame(), use_container_width=True, hide_index=True)
 
 df_raw = load_data()
 
+# ====================== HELPER GRAFIK ======================
+def show_chart(chart):
+    # Matplotlib dirender di server, Altair dikirim sebagai JSON dan dirender di browser
+    if isinstance(chart, dict):
+        # Snapshot dari stage render pipeline (PNG / spec Vega-Lite), dipakai bersama semua sesi
+        if chart["backend"] == "altair":
+            st.vega_lite_chart(json.loads(chart["spec"]), use_container_width=True)
+        else:
+            st.image(chart["png"], use_container_width=True)
+        return
+    if chart_backend == "altair":
+        st.altair_chart(chart, use_container_width=True)
+    else:
+        st.pyplot(chart)
+
 # ====================== SIDEBAR NAVIGATION ======================
 with st.sidebar:
     st.markdown("## 🧭 Navigasi CRISP-DM")
@@ -103,11 +299,50 @@ with st.sidebar:
             "🔍 Data Understanding", 
             "🧹 Data Preparation",
             "🤖 Modeling",
-            "✅ Evaluation"
+            "✅ Evaluation",
+            "🎲 Simulasi Skenario"
         ],
         label_visibility="collapsed"
     )
     
+    st.markdown("---")
+    with st.expander("⚙️ Pengaturan Grafik"):
+        chart_backend = st.selectbox(
+            "Backend Grafik", CHART_BACKENDS,
+            format_func=lambda b: {"matplotlib": "Matplotlib (render di server)", "altair": "Altair (interaktif, render di browser)"}[b]
+        )
+        chart_max_points = st.number_input(
+            "Maks. Titik per Garis", min_value=50, max_value=20000, value=2000, step=50,
+            help="Series yang lebih panjang akan di-downsample sebelum plotting"
+        )
+        chart_downsample_method = st.selectbox(
+            "Metode Downsampling", DOWNSAMPLE_METHODS,
+            format_func=lambda m: {"lttb": "LTTB (Largest-Triangle-Three-Buckets)", "minmax": "Min-Max Envelope"}[m]
+        )
+    
+    with st.expander("🗄️ Shared Cache"):
+        cache_stats = shared_cache.stats()
+        st.text(f"Entries  : {cache_stats['entries']}")
+        st.text(f"Ukuran   : {cache_stats['bytes'] / 1024:.1f} / {cache_stats['max_bytes'] / 1024 ** 2:.0f} MB")
+        st.text(f"Hit rate : {cache_stats['hit_rate'] * 100:.1f}% ({cache_stats['hits']} hit, {cache_stats['misses']} miss)")
+        st.text(f"Eviction : {cache_stats['evictions']}")
+        warmer_stats = warmer.stats()
+        st.text(f"Warmer   : {warmer_stats['computed']} dihitung, {warmer_stats['pending']} antre")
+        st.text(f"Warm hit : {warmer_stats['warm_hits']}/{warmer_stats['requests']} ({warmer_stats['warm_hit_rate'] * 100:.0f}%)")
+        if st.button("🧹 Kosongkan Cache", use_container_width=True):
+            shared_cache.clear()
+            pipeline.clear_memory()
+    
+    with st.expander("🧵 Background Jobs"):
+        session_jobs = job_manager.jobs(st.session_state.get("job_ids", []))
+        if not session_jobs:
+            st.caption("Belum ada job di sesi ini.")
+        for job in session_jobs[:10]:
+            st.text(f"{JOB_ICONS[job.status]} {job.label}")
+            st.progress(job.progress, text=f"{job.status} · {job.elapsed:.1f} s")
+            if job.active and st.button("⛔ Batalkan", key=f"sidebar_cancel_{job.id}", use_container_width=True):
+                job_manager.cancel(job.id)
+    
     st.markdown("---")
     st.markdown("""
     <div style='padding: 15px; background: #1a202c; border-radius: 10px; border-left: 3px solid #00E396;'>
@@ -256,25 +491,21 @@ elif menu == "🔍 Data Understanding":
     
     # 4. Visualisasi Tren Time Series
     st.header("4. Visualisasi Tren Time Series")
-    df_forecast = df_raw[['Year', 'gini_disp']].copy()
-    
-    fig, ax = plt.subplots(figsize=(10,4))
-    ax.plot(df_forecast['Year'], df_forecast['gini_disp'], marker='o', color='#00E396', linewidth=2)
-    ax.set_title("Trend Gini Disposable Income (South Africa)", fontsize=14, fontweight='bold', color='white')
-    ax.set_xlabel("Year", fontsize=12, color='white')
-    ax.set_ylabel("Gini Disposable Income", fontsize=12, color='white')
-    ax.set_facecolor('#0E1117')
-    fig.patch.set_facecolor('#0E1117')
-    ax.tick_params(colors='white')
-    ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    st.pyplot(fig)
+    df_forecast = df_raw[['Year', 'gini_disp']]
+    
+    chart = line_chart(
+        [{'x': df_forecast['Year'], 'y': df_forecast['gini_disp'], 'color': '#00E396', 'marker': 'o'}],
+        "Trend Gini Disposable Income (South Africa)", "Year", "Gini Disposable Income",
+        backend=chart_backend, max_points=chart_max_points, method=chart_downsample_method,
+        figsize=(10, 4), legend=False
+    )
+    show_chart(chart)
     
     # 5. Ringkasan Kualitas Data
     st.header("5. Ringkasan Kualitas Data")
     
     # Fokus pada variabel utama
-    df_q = df_raw[['Year', 'gini_disp']].copy()
+    df_q = df_raw[['Year', 'gini_disp']]
     
     # Missing value
     missing_value = df_q['gini_disp'].isnull().sum()
@@ -343,8 +574,8 @@ elif menu == "🧹 Data Preparation":
     st.markdown("*Data Cleaning, Transformation, dan Exploration untuk Income Inequality South Africa*")
     st.markdown("---")
     
-    # Load data original untuk perbandingan
-    df_original = df_raw.copy()
+    # Data original untuk perbandingan (view read-only, tidak disalin)
+    df_original = df_raw
     
     # ========== STEP 1: Data Loading & Initial Exploration ==========
     st.markdown("## 📥 STEP 1: Data Loading & Initial Exploration")
@@ -353,8 +584,8 @@ elif menu == "🧹 Data Preparation":
     <div class='highlight-box'>
         <strong>📌 Penjelasan Step 1:</strong><br>
         ✓ Membaca file Excel yang berisi data Income Inequality South Africa<br>
-        ✓ Menggunakan @st.cache_data untuk optimasi performa (data tidak reload setiap kali interaksi)<br>
-        ✓ Menyimpan copy original untuk perbandingan sebelum vs sesudah preprocessing
+        ✓ Data dimuat sekali lewat pipeline + shared cache dan dipakai bersama semua sesi sebagai data read-only<br>
+        ✓ Data original dipakai langsung (tanpa copy) untuk perbandingan sebelum vs sesudah preprocessing
     </div>
     """, unsafe_allow_html=True)
     
@@ -438,18 +669,14 @@ elif menu == "🧹 Data Preparation":
     </div>
     """, unsafe_allow_html=True)
     
-    # Sort dan Interpolasi
-    df_clean = df_original.sort_values(by='Year').reset_index(drop=True)
+    # Sort dan Interpolasi (stage "clean" pada pipeline, di-cache bersama halaman Modeling/Evaluation)
+    df_clean = pipeline.run(dataset_params(), ["clean"])["clean"]
     
     # Ambil kolom numerik selain Year
     numeric_cols = df_clean.select_dtypes(include='number').columns.tolist()
     if 'Year' in numeric_cols:
         numeric_cols.remove('Year')
     
-    # Lakukan interpolasi
-    for col in numeric_cols:
-        df_clean[col] = df_clean[col].interpolate(method='linear')
-    
     st.success("✅ Data telah disort berdasarkan Year dan dilakukan interpolasi linear")
     
     # Tampilkan hasil interpolasi
@@ -480,27 +707,21 @@ elif menu == "🧹 Data Preparation":
     # Pilih kolom untuk visualisasi interpolasi
     selected_col_interp = st.selectbox("Pilih Kolom untuk Visualisasi Interpolasi:", numeric_cols)
     
-    fig, ax = plt.subplots(figsize=(12, 5))
-    
-    # Plot sebelum interpolasi (original dengan missing values)
-    ax.plot(df_original['Year'], df_original[selected_col_interp],
-            'o-', color='#EF4444', label='Before (Raw Data)', alpha=0.7, linewidth=2, markersize=8)
-    
-    # Plot sesudah interpolasi
-    ax.plot(df_clean['Year'], df_clean[selected_col_interp],
-            '-', color='#00E396', label='After Interpolation', linewidth=2.5)
-    
-    ax.set_title(f"Perbandingan Interpolasi: {selected_col_interp}", fontsize=14, fontweight='bold', color='white')
-    ax.set_xlabel("Year", fontsize=12, color='white')
-    ax.set_ylabel(selected_col_interp, fontsize=12, color='white')
-    ax.set_facecolor('#0E1117')
-    fig.patch.set_facecolor('#0E1117')
-    ax.tick_params(colors='white')
-    ax.grid(True, alpha=0.3)
-    ax.legend(facecolor='#1a202c', edgecolor='#334155', labelcolor='white')
-    plt.tight_layout()
+    chart = line_chart(
+        [
+            # Plot sebelum interpolasi (original dengan missing values)
+            {'x': df_original['Year'], 'y': df_original[selected_col_interp], 'label': 'Before (Raw Data)',
+             'color': '#EF4444', 'marker': 'o', 'alpha': 0.7, 'markersize': 8},
+            # Plot sesudah interpolasi
+            {'x': df_clean['Year'], 'y': df_clean[selected_col_interp], 'label': 'After Interpolation',
+             'color': '#00E396', 'linewidth': 2.5},
+        ],
+        f"Perbandingan Interpolasi: {selected_col_interp}", "Year", selected_col_interp,
+        backend=chart_backend, max_points=chart_max_points, method=chart_downsample_method,
+        figsize=(12, 5)
+    )
     
-    st.pyplot(fig)
+    show_chart(chart)
     
     st.markdown("---")
     
@@ -528,7 +749,7 @@ elif menu == "🧹 Data Preparation":
             selected_cols.append(col)
     
     # Filter dataframe
-    df_filtered = df_clean[selected_cols].copy()
+    df_filtered = df_clean[selected_cols]
     
     st.subheader("Kolom yang Dipilih untuk Analisis")
     col_descriptions = {
@@ -587,44 +808,11 @@ elif menu == "🧹 Data Preparation":
         key="outlier_selectbox"
     )
     
-    # Buat boxplot
-    fig, ax = plt.subplots(figsize=(10, 7))
-    
     # Data untuk boxplot
     data_to_plot = df_filtered[selected_col_outlier].dropna()
     
-    # Boxplot styling
-    bp = ax.boxplot(data_to_plot, patch_artist=True, widths=0.5)
-    
-    # Styling boxplot
-    for patch in bp['boxes']:
-        patch.set_facecolor('#00E396')
-        patch.set_alpha(0.7)
-    
-    for whisker in bp['whiskers']:
-        whisker.set(color='#00E396', linewidth=2)
-    
-    for cap in bp['caps']:
-        cap.set(color='#00E396', linewidth=2)
-    
-    for median in bp['medians']:
-        median.set(color='#FEB019', linewidth=2)
-    
-    for flier in bp['fliers']:
-        flier.set(marker='o', color='#EF4444', markersize=8, alpha=0.8)
-    
-    # Styling
-    ax.set_title(f"Boxplot - {selected_col_outlier}", fontsize=14, fontweight='bold', color='white')
-    ax.set_ylabel(selected_col_outlier, fontsize=12, color='white')
-    ax.set_xticks([1])
-    ax.set_xticklabels([selected_col_outlier], color='white')
-    ax.set_facecolor('#0E1117')
-    fig.patch.set_facecolor('#0E1117')
-    ax.tick_params(colors='white')
-    ax.grid(True, alpha=0.3, axis='y')
-    plt.tight_layout()
-    
-    st.pyplot(fig)
+    # Buat boxplot
+    show_chart(box_chart(data_to_plot, selected_col_outlier, backend=chart_backend))
     
     # Statistik Outlier
     st.subheader("📈 Statistik Outlier")
@@ -764,6 +952,22 @@ elif menu == "🤖 Modeling":
     </div>
     """, unsafe_allow_html=True)
     
+    with st.expander("📝 Formula Holt-Winters (Triple Exponential Smoothing, musiman)"):
+        st.markdown("""
+        <div class='highlight-box'>
+            <strong>Additive:</strong><br>
+            <code>Lt = α × (Yt - St-m) + (1 - α) × (Lt-1 + Tt-1)</code><br>
+            <code>Tt = β × (Lt - Lt-1) + (1 - β) × Tt-1</code><br>
+            <code>St = γ × (Yt - Lt) + (1 - γ) × St-m</code><br>
+            <code>Ft+h = Lt + h × Tt + St+h-m</code><br><br>
+            <strong>Multiplicative:</strong><br>
+            <code>Lt = α × (Yt / St-m) + (1 - α) × (Lt-1 + Tt-1)</code><br>
+            <code>St = γ × (Yt / Lt) + (1 - γ) × St-m</code><br>
+            <code>Ft+h = (Lt + h × Tt) × St+h-m</code><br><br>
+            Dengan grid search, semua kombinasi (α, β, γ) dihitung sekaligus dan dipilih SSE one-step terkecil.
+        </div>
+        """, unsafe_allow_html=True)
+    
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Interactive Demo
@@ -772,60 +976,76 @@ elif menu == "🤖 Modeling":
     with st.sidebar:
         st.markdown("---")
         st.markdown("### 📊 Parameter Model")
-        alpha = st.slider("Alpha (α)", min_value=0.01, max_value=0.99, value=0.60, step=0.01)
+        alpha, spec = model_sidebar()
         periods_ahead = st.number_input("Periode Prediksi", min_value=1, max_value=20, value=5)
         
         if st.button("🔥 Hitung Forecast", type="primary", use_container_width=True):
             st.session_state.calculate = True
     
     if st.session_state.get("calculate", False):
-        # Perhitungan
-        # Lakukan interpolasi agar time series tidak bolong
-        df_clean = df_raw[['Year', 'gini_disp']].sort_values('Year').reset_index(drop=True)
-        df_clean['gini_disp'] = df_clean['gini_disp'].interpolate(method='linear')
-        df_clean = df_clean.dropna() # Drop rows yang masih NaN (misal di awal/akhir)
-
-        Y = df_clean['gini_disp'].values.astype(float)
-        years = df_clean['Year'].values.astype(int)
+        # Perhitungan (hanya stage yang inputnya berubah yang dijalankan ulang)
+        result = run_pipeline(alpha, periods_ahead, spec=spec)
+        years, Y = result["select"]["years"], result["select"]["Y"]
+        labels = result["select"]["labels"]
         n = len(Y)
         
-        S1 = [Y[0]]
-        S2 = [Y[0]]
-        for t in range(1, n):
-            S1.append(alpha * Y[t] + (1 - alpha) * S1[t-1])
-            S2.append(alpha * S1[t] + (1 - alpha) * S2[t-1])
-        
-        a = [2 * S1[i] - S2[i] for i in range(n)]
-        b = [((alpha / (1 - alpha)) * (S1[i] - S2[i])) if (1 - alpha) != 0 else 0.0 for i in range(n)]
-        
-        forecast = [None]
-        for i in range(1, n):
-            forecast.append(a[i-1] + b[i-1])
+        res = result["model"]
+        forecast = res["forecast"]
         
         # Tabel Hasil
         st.markdown("#### 📋 Tabel Perhitungan")
+        if spec is None:
+            S1, S2, a, b = res["S1"], res["S2"], res["a"], res["b"]
+            components = {"S't": S1, "S''t": S2, "at": a, "bt": b}
+        elif spec["model"] == "hw":
+            st.caption(f"Holt-Winters {res['seasonal']}, m = {res['season_length']}: "
+                       f"α = {res['alpha']:.2f}, β = {res['beta']:.2f}, γ = {res['gamma']:.2f}"
+                       + (" (hasil grid search)" if spec["hw_optimize"] else ""))
+            components = {"Level (Lt)": res["level"], "Trend (Tt)": res["trend"], "Musiman (St)": res["season"]}
+        else:
+            st.caption(f"Model terpilih ({spec['criterion']}): {res['description']}; residual dihaluskan DES α = {alpha:.2f}")
+            components = {"Regresi (Xβ)": res["regression"], "Residual (ut)": res["residual"],
+                          "at (ut)": res["a"], "bt (ut)": res["b"]}
         table_data = []
         for i in range(n):
             table_data.append({
                 "No": i + 1,
-                "Tahun": int(years[i]),
+                PERIOD_NAME: labels[i],
                 "Gini (Yt)": f"{Y[i]:.4f}",
-                "S't": f"{S1[i]:.4f}",
-                "S''t": f"{S2[i]:.4f}",
-                "at": f"{a[i]:.4f}",
-                "bt": f"{b[i]:.4f}",
-                "Forecast": f"{forecast[i]:.4f}" if forecast[i] is not None else "-",
+                **{name: f"{values[i]:.4f}" if np.isfinite(values[i]) else "-" for name, values in components.items()},
+                "Forecast": f"{forecast[i]:.4f}" if not np.isnan(forecast[i]) else "-",
             })
         st.dataframe(pd.DataFrame(table_data), use_container_width=True, hide_index=True)
-        
+
+        if spec is not None and spec["model"] == "reg":
+            search = result["reg_search"]
+            col_cand, col_coef = st.columns([3, 2])
+            with col_cand:
+                st.markdown(f"#### 🧮 Kandidat Terbaik ({len(search['lags']):,} model, n = {search['n_obs']})")
+                top = range(min(10, len(search["lags"])))
+                st.dataframe(pd.DataFrame({
+                    "Driver (lag)": [describe_lags(spec["drivers"], search["lags"][i]) for i in top],
+                    "k": [int(search["n_params"][i]) for i in top],
+                    "AIC": [f"{search['aic'][i]:.2f}" for i in top],
+                    "BIC": [f"{search['bic'][i]:.2f}" for i in top],
+                    "R² adj": [f"{search['r2_adj'][i]:.4f}" for i in top],
+                }), use_container_width=True, hide_index=True)
+            with col_coef:
+                st.markdown("#### 📐 Koefisien Regresi")
+                fit = res["fit"]
+                st.dataframe(pd.DataFrame({
+                    "Variabel": fit["coef_names"],
+                    "Koefisien": [f"{c:.6g}" for c in fit["coef"]],
+                }), use_container_width=True, hide_index=True)
+
         # Prediksi
         # surya, modeling grafik dan forecast periode tertentu
-        future_years = [years[-1] + k + 1 for k in range(periods_ahead)]
-        future_forecasts = [a[-1] + b[-1] * m for m in range(1, periods_ahead + 1)]
+        future_labels = result["forecast"]["future_labels"]
+        future_forecasts = result["forecast"]["future_forecasts"]
         
-        st.markdown(f"#### 🔮 Prediksi {periods_ahead} Tahun ke Depan")
+        st.markdown(f"#### 🔮 Prediksi {periods_ahead} {PERIOD_NAME} ke Depan")
         pred_df = pd.DataFrame({
-            "Tahun": future_years,
+            PERIOD_NAME: future_labels,
             "Prediksi Gini": [f"{v:.4f}" for v in future_forecasts]
         })
         st.dataframe(pred_df, use_container_width=True, hide_index=True)
@@ -834,32 +1054,8 @@ elif menu == "🤖 Modeling":
         st.markdown("<br>", unsafe_allow_html=True)
         st.subheader("📈 Visualisasi: Aktual vs Forecast")
         
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Plot data aktual
-        ax.plot(years, Y, marker='o', label='Actual GINI', color='#00E396', linewidth=2, markersize=6)
-        
-        # Plot forecast in-sample
-        forecast_clean = [f if f is not None else np.nan for f in forecast]
-        ax.plot(years, forecast_clean, marker='x', linestyle='--', label='Forecast (In-sample)', color='#00D1FF', linewidth=2)
-        
-        # Plot forecast future
-        ax.plot(future_years, future_forecasts, marker='s', linestyle='--', label='Forecast (Future)', color='#FEB019', linewidth=2, markersize=8)
-        
-        # Garis pemisah
-        ax.axvline(x=years[-1], color='#EF4444', linestyle=':', alpha=0.7, label='Cutoff')
-        
-        # Styling
-        ax.set_xlabel('Year', fontsize=12, color='white')
-        ax.set_ylabel('GINI Coefficient', fontsize=12, color='white')
-        ax.set_title(f'Forecasting Gini Coefficient (α = {alpha})', fontsize=14, fontweight='bold', color='white')
-        ax.set_facecolor('#0E1117')
-        fig.patch.set_facecolor('#0E1117')
-        ax.tick_params(colors='white')
-        ax.legend(facecolor='#1a202c', edgecolor='#334155', labelcolor='white')
-        ax.grid(True, alpha=0.3)
-        
-        st.pyplot(fig)
+        show_chart(result["render"])
+        show_pipeline_report(result)
         st.success("✅ Modeling dan visualisasi berhasil dijalankan!")
         
     else:
@@ -882,7 +1078,7 @@ elif menu == "✅ Evaluation":
     with st.sidebar:
         st.markdown("---")
         st.markdown("### 📊 Parameter Evaluasi")
-        alpha = st.slider("Alpha (α)", min_value=0.01, max_value=0.99, value=0.60, step=0.01, key="eval_alpha")
+        alpha, spec = model_sidebar("eval_alpha")
         periods_ahead = st.number_input("Periode Prediksi", min_value=1, max_value=20, value=5, key="eval_periods")
         
         if st.button("📊 Evaluasi Model", type="primary", use_container_width=True):
@@ -900,6 +1096,10 @@ elif menu == "✅ Evaluation":
                 <li><strong>MSE</strong>: Mean Squared Error</li>
                 <li><strong>RMSE</strong>: Root Mean Squared Error</li>
                 <li><strong>MAPE</strong>: Mean Absolute Percentage Error</li>
+                <li><strong>sMAPE</strong>: Symmetric MAPE</li>
+                <li><strong>MASE</strong>: Mean Absolute Scaled Error (vs naive)</li>
+                <li><strong>Theil's U</strong>: &lt; 1 lebih baik dari naive</li>
+                <li><strong>Bias</strong>: Rata-rata error (aktual - forecast)</li>
             </ul>
         </div>
         """, unsafe_allow_html=True)
@@ -920,50 +1120,24 @@ elif menu == "✅ Evaluation":
     st.markdown("<br>", unsafe_allow_html=True)
     
     if st.session_state.get("evaluate", False):
-        # Perhitungan
-        # Lakukan interpolasi agar time series tidak bolong
-        df_clean = df_raw[['Year', 'gini_disp']].sort_values('Year').reset_index(drop=True)
-        df_clean['gini_disp'] = df_clean['gini_disp'].interpolate(method='linear')
-        df_clean = df_clean.dropna()
-
-        Y = df_clean['gini_disp'].values.astype(float)
-        years = df_clean['Year'].values.astype(int)
+        # Perhitungan (hanya stage yang inputnya berubah yang dijalankan ulang)
+        result = run_pipeline(alpha, periods_ahead, spec=spec)
+        years, Y = result["select"]["years"], result["select"]["Y"]
         n = len(Y)
         
-        S1 = [Y[0]]
-        S2 = [Y[0]]
-        for t in range(1, n):
-            S1.append(alpha * Y[t] + (1 - alpha) * S1[t-1])
-            S2.append(alpha * S1[t] + (1 - alpha) * S2[t-1])
-        
-        a = [2 * S1[i] - S2[i] for i in range(n)]
-        b = [((alpha / (1 - alpha)) * (S1[i] - S2[i])) if (1 - alpha) != 0 else 0.0 for i in range(n)]
-        
-        forecast = [None]
-        for i in range(1, n):
-            forecast.append(a[i-1] + b[i-1])
+        res = result["model"]
+        forecast = res["forecast"]
+        if spec is None:
+            model_desc = f"Double Exponential Smoothing dengan α = {alpha:.2f}"
+        elif spec["model"] == "hw":
+            model_desc = (f"Holt-Winters {res['seasonal']} (m = {res['season_length']}) dengan α = {res['alpha']:.2f}, "
+                          f"β = {res['beta']:.2f}, γ = {res['gamma']:.2f}")
+        else:
+            model_desc = f"Regresi driver [{res['description']}] + DES error dengan α = {alpha:.2f}"
         
         # Error calculation
-        error = [None]
-        abs_error = [None]
-        error2 = [None]
-        for i in range(1, n):
-            f = forecast[i]
-            if f is not None:
-                e = Y[i] - f
-                error.append(e)
-                abs_error.append(abs(e))
-                error2.append(e**2)
-        
-        valid_errors = [e for e in error if e is not None]
-        valid_indices = [i for i in range(n) if error[i] is not None]
-        
-        MAE = np.mean(np.abs(valid_errors))
-        MSE = np.mean(np.square(valid_errors))
-        RMSE = np.sqrt(MSE)
-        valid_y = np.array([Y[i] for i in valid_indices if Y[i] != 0])
-        valid_abs_error = np.array([abs_error[i] for i in valid_indices if Y[i] != 0])
-        MAPE = float(np.nanmean(valid_abs_error / valid_y) * 100)
+        metrics = result["evaluate"]
+        MAE, MSE, RMSE, MAPE = metrics["MAE"], metrics["MSE"], metrics["RMSE"], metrics["MAPE"]
         
         # Display Metrics
         st.subheader("📊 Hasil Evaluasi Model")
@@ -994,8 +1168,7 @@ elif menu == "✅ Evaluation":
             </div>
             """, unsafe_allow_html=True)
         with cols[3]:
-            mape_color = "🟢" if MAPE < 5 else "🟡" if MAPE < 10 else "🟠" if MAPE < 20 else "🔴"
-            mape_desc = "Sangat Baik" if MAPE < 5 else "Baik" if MAPE < 10 else "Cukup" if MAPE < 20 else "Perlu Perbaikan"
+            mape_color, mape_desc = mape_category(MAPE)
             st.markdown(f"""
             <div class='metric-card'>
                 <h3>{mape_color} {MAPE:.2f}%</h3>
@@ -1006,45 +1179,183 @@ elif menu == "✅ Evaluation":
         
         st.markdown("<br>", unsafe_allow_html=True)
         
-        # Visualization
-        st.subheader("📈 Visualisasi: Aktual vs Forecast")
+        extra_metrics = [
+            (f"{metrics['sMAPE']:.2f}%", "sMAPE", "Symmetric MAPE"),
+            (f"{metrics['MASE']:.4f}", "MASE", "Mean Absolute Scaled Error"),
+            (f"{metrics['TheilU']:.4f}", "Theil's U", "< 1 lebih baik dari naive"),
+            (f"{metrics['Bias']:+.4f}", "Bias", "Rata-rata (aktual - forecast)"),
+        ]
+        for col, (value, name, desc) in zip(st.columns(4), extra_metrics):
+            with col:
+                st.markdown(f"""
+                <div class='metric-card'>
+                    <h3>{value}</h3>
+                    <p>{name}</p>
+                    <small>{desc}</small>
+                </div>
+                """, unsafe_allow_html=True)
         
-        future_years = [years[-1] + k + 1 for k in range(periods_ahead)]
-        future_forecasts = [a[-1] + b[-1] * m for m in range(1, periods_ahead + 1)]
+        st.markdown("<br>", unsafe_allow_html=True)
         
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.plot(years, Y, marker='o', label='Actual GINI', color='#00E396', linewidth=2, markersize=6)
+        # Visualization
+        st.subheader("📈 Visualisasi: Aktual vs Forecast")
         
-        forecast_clean = [f if f is not None else np.nan for f in forecast]
-        ax.plot(years, forecast_clean, marker='x', linestyle='--', label='Forecast (In-sample)', color='#00D1FF', linewidth=2)
-        ax.plot(future_years, future_forecasts, marker='s', linestyle='--', label='Forecast (Future)', color='#FEB019', linewidth=2, markersize=8)
+        future_labels = result["forecast"]["future_labels"]
+        future_forecasts = result["forecast"]["future_forecasts"]
         
-        ax.axvline(x=years[-1], color='#EF4444', linestyle=':', alpha=0.7, label='Cutoff')
-        ax.set_xlabel('Year', fontsize=12, color='white')
-        ax.set_ylabel('GINI Coefficient', fontsize=12, color='white')
-        ax.set_title(f'Forecasting Gini Coefficient (α = {alpha})', fontsize=14, fontweight='bold', color='white')
-        ax.set_facecolor('#0E1117')
-        fig.patch.set_facecolor('#0E1117')
-        ax.tick_params(colors='white')
-        ax.legend(facecolor='#1a202c', edgecolor='#334155', labelcolor='white')
-        ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
+        show_chart(result["render"])
+        show_pipeline_report(result)
         
         # Conclusion
         st.markdown("<br>", unsafe_allow_html=True)
         st.markdown(f"""
         <div class='highlight-box'>
             <strong>📝 Kesimpulan</strong><br><br>
-            Model Double Exponential Smoothing dengan α = {alpha:.2f} menghasilkan MAPE sebesar <strong>{MAPE:.2f}%</strong> 
+            Model {model_desc} menghasilkan MAPE sebesar <strong>{MAPE:.2f}%</strong> 
             yang termasuk kategori <strong>{mape_desc}</strong>.<br><br>
-            Prediksi Gini Coefficient untuk {periods_ahead} tahun ke depan menunjukkan tren 
+            Prediksi Gini Coefficient untuk {periods_ahead} {PERIOD_NAME.lower()} ke depan menunjukkan tren 
             {'meningkat' if future_forecasts[-1] > Y[-1] else 'menurun'} dari nilai terakhir {Y[-1]:.4f} 
-            menjadi {future_forecasts[-1]:.4f} pada tahun {future_years[-1]}.
+            menjadi {future_forecasts[-1]:.4f} pada {PERIOD_NAME.lower()} {future_labels[-1]}.
         </div>
         """, unsafe_allow_html=True)
+        
+        # Export laporan (format laporan mengikuti perhitungan DES)
+        st.markdown("<br>", unsafe_allow_html=True)
+        if spec is None:
+            report_args = (dataset_params(), alpha, periods_ahead)
+            if st.button("📝 Buat Laporan (HTML)"):
+                st.session_state.report_args = report_args
+            if st.session_state.get("report_args") == report_args:
+                with st.spinner("Menyusun laporan..."):
+                    report_html = cached_report(*report_args)
+                st.download_button(
+                    "⬇️ Download Laporan (HTML)",
+                    data=report_html,
+                    file_name=f"report_gini_disp_a{alpha:.2f}_p{periods_ahead}.html",
+                    mime="text/html",
+                )
+        else:
+            st.caption("ℹ️ Laporan HTML tersedia untuk model DES.")
+        
+        # Sweep alpha + backtest rolling-origin sebagai background job
+        if spec is None:
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.subheader("🔁 Sweep α & Backtest Rolling-Origin")
+            st.caption("Setiap α (0.01 - 0.99) diuji dengan forecast h langkah dari setiap titik origin; "
+                       "dihitung di process pool tanpa memblokir halaman.")
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                bt_horizon = st.number_input("Horizon backtest", min_value=1, max_value=10, value=3)
+            with c2:
+                bt_min_train = st.number_input("Minimal data latih", min_value=3, max_value=max(3, n - 2), value=min(10, max(3, n - 2)))
+            with c3:
+                bt_timeout = st.number_input("Timeout (detik)", min_value=5, max_value=600, value=60)
+            if st.button("▶️ Jalankan di Background", use_container_width=True):
+                track_job("sweep_job", job_manager.submit_map(
+                    partial(des_backtest, Y, horizon=int(bt_horizon), min_train=int(bt_min_train)), ALPHA_SWEEP,
+                    label=f"Sweep α backtest (h = {bt_horizon})", timeout=bt_timeout, kind="process"
+                ))
+            show_job(st.session_state.get("sweep_job"), show_sweep_result)
     else:
         st.info("👈 Atur parameter di sidebar dan klik **Evaluasi Model** untuk melihat hasil evaluasi.")
 
+# ==================== 6. SIMULASI SKENARIO ====================
+elif menu == "🎲 Simulasi Skenario":
+    st.markdown("# 🎲 Simulasi Skenario Kebijakan")
+    st.markdown("*Monte Carlo forecast Gini dengan shock kebijakan pada level dan trend*")
+    st.markdown("---")
+    
+    st.markdown("""
+    <div class='process-header'>
+        <h3>🏛️ Apakah kebijakan efektif menurunkan ketimpangan?</h3>
+        <p>Model DES disimulasikan ribuan kali dengan error acak dari residual in-sample.
+        Shock kebijakan (perubahan level, perubahan trend, atau perubahan GOVEXP/GOVEDU) diterapkan
+        pada state level (a) dan trend (b), lalu distribusi hasilnya diringkas sebagai fan chart.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    with st.sidebar:
+        st.markdown("---")
+        st.markdown("### 🎲 Parameter Simulasi")
+        alpha = round(st.slider("Alpha (α)", min_value=0.01, max_value=0.99, value=0.60, step=0.01, key="sim_alpha"), 2)
+        periods_ahead = st.number_input("Periode Prediksi", min_value=1, max_value=20, value=10, key="sim_periods")
+        n_paths = st.select_slider("Jumlah Path", options=[1000, 5000, 10000, 20000, 50000], value=10000)
+        bootstrap = st.checkbox("Bootstrap residual (bukan Normal)", value=False)
+        
+        if st.button("🎲 Jalankan Simulasi", type="primary", use_container_width=True):
+            st.session_state.simulate = True
+    
+    series = pipeline.run({**dataset_params(), "col": 'gini_disp'}, ["select"])["select"]
+    years, Y = series["years"], series["Y"]
+    
+    st.subheader("🛠️ Definisi Skenario")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("**Shock Level (sekali)**")
+        level_shock = st.number_input("Perubahan level Gini", value=0.0, step=0.1, format="%.2f")
+        level_shock_step = st.number_input("Mulai periode ke-", min_value=1, max_value=int(periods_ahead), value=1, key="level_step")
+    with col2:
+        st.markdown("**Perubahan Trend (permanen)**")
+        trend_change = st.number_input("Perubahan trend per tahun", value=0.0, step=0.05, format="%.2f")
+        trend_change_step = st.number_input("Mulai periode ke-", min_value=1, max_value=int(periods_ahead), value=1, key="trend_step")
+    with col3:
+        st.markdown("**Driver Kebijakan**")
+        driver_options = ["(Tidak ada)"] + [c for c in ['GOVEXP', 'GOVEDU'] if c in df_raw.columns]
+        driver = st.selectbox("Driver", driver_options)
+        if driver != "(Tidak ada)":
+            driver_change = st.number_input(f"Perubahan {driver} per tahun", value=1.0, step=0.1, format="%.2f")
+            driver_effect = st.number_input(
+                "Efek ke Gini per unit driver", value=estimate_driver_effect(df_raw, driver), format="%.4f",
+                help="Default: slope OLS perubahan Gini terhadap perubahan driver (data historis)"
+            )
+        else:
+            driver_change, driver_effect = 0.0, 0.0
+    threshold = st.number_input("Threshold Gini (target kebijakan)", value=float(round(Y[-1] - 1, 1)), step=0.5)
+    
+    if st.session_state.get("simulate", False):
+        result = run_pipeline(alpha, periods_ahead, targets=("model", "forecast"))
+        res = result["model"]
+        baseline = result["forecast"]["future_forecasts"]
+        residuals = Y[1:] - res["forecast"][1:]
+        level_shift, trend_shift = scenario_shifts(
+            periods_ahead, level_shock, level_shock_step, trend_change, trend_change_step,
+            driver_deltas=np.full(periods_ahead, driver_change), driver_effect=driver_effect
+        )
+        paths = simulate_paths(res["a"][-1], res["b"][-1], alpha, residuals, periods_ahead, n_paths=n_paths,
+                               level_shift=level_shift, trend_shift=trend_shift, bootstrap=bootstrap)
+        summary = summarize_paths(paths, threshold=threshold, reference=Y[-1])
+        future_years = result["forecast"]["future_years"]
+        future_labels = result["forecast"]["future_labels"]
+        
+        st.subheader("📊 Hasil Simulasi")
+        cols = st.columns(4)
+        with cols[0]:
+            st.metric("Median Akhir", f"{summary['quantiles'][0.5][-1]:.4f}",
+                      delta=f"{summary['quantiles'][0.5][-1] - baseline[-1]:.4f} vs baseline",
+                      delta_color="inverse")
+        with cols[1]:
+            st.metric("P(Gini turun)", f"{summary['p_decrease_end'] * 100:.1f}%",
+                      help=f"Peluang nilai {PERIOD_NAME.lower()} {future_labels[-1]} di bawah nilai terakhir {Y[-1]:.4f}")
+        with cols[2]:
+            st.metric("P(< threshold, akhir)", f"{summary['p_below_threshold_end'] * 100:.1f}%")
+        with cols[3]:
+            st.metric("P(< threshold, kapan pun)", f"{summary['p_below_threshold_any'] * 100:.1f}%")
+        
+        chart = fan_chart(years, Y, future_years, summary["quantiles"], baseline=baseline,
+                          threshold=threshold, title=f"Fan Chart Skenario (α = {alpha}, {n_paths:,} path)",
+                          backend=chart_backend, max_points=chart_max_points, method=chart_downsample_method)
+        show_chart(chart)
+        
+        fan_df = pd.DataFrame({
+            PERIOD_NAME: future_labels,
+            "Baseline": [f"{v:.4f}" for v in baseline],
+            **{f"P{int(q * 100)}": [f"{v:.4f}" for v in summary["quantiles"][q]] for q in summary["quantiles"]},
+            "P(< threshold)": [f"{p * 100:.1f}%" for p in summary["p_below_threshold"]],
+        })
+        st.dataframe(fan_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("👈 Atur skenario lalu klik **Jalankan Simulasi** di sidebar.")
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -0,0 +1,72 @@
+import numpy as np
+
+# ====================== METRIK AKURASI FORECAST ======================
+# Semua metrik dihitung sekali jalan dari satu array error dan satu mask validitas,
+# tanpa filter list di Python. Input boleh 1-D (satu series) atau N-D dengan
+# waktu di sumbu terakhir (mis. baris = alpha/horizon/series berbeda).
+#
+#   error = actual - forecast      (sama dengan definisi di halaman Evaluation)
+#   Bias  = mean(error)            (> 0 berarti forecast terlalu rendah)
+
+METRIC_NAMES = ("MAE", "MSE", "RMSE", "MAPE", "sMAPE", "MASE", "TheilU", "Bias")
+
+
+def _safe_div(num, den):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(den > 0, num / np.where(den > 0, den, 1.0), np.nan)
+
+
+def compute_metrics(actual, forecast, season=1):
+    """Hitung MAE, MSE, RMSE, MAPE, sMAPE, MASE, Theil's U dan Bias.
+
+    Titik dengan NaN pada actual atau forecast diabaikan. MAPE melewati actual = 0,
+    sMAPE melewati |actual| + |forecast| = 0. MASE diskalakan dengan MAE naive
+    musiman (lag `season`) pada actual; Theil's U (U2) membandingkan error relatif
+    terhadap forecast naive no-change. Hasil berupa float untuk input 1-D, atau
+    array dengan bentuk sumbu-sumbu depan untuk input N-D.
+    """
+    y, f = np.broadcast_arrays(np.asarray(actual, dtype=float), np.asarray(forecast, dtype=float))
+    valid = np.isfinite(y) & np.isfinite(f)
+    e = np.where(valid, y - f, 0.0)
+    abs_e = np.abs(e)
+    n = valid.sum(axis=-1)
+
+    sum_e = e.sum(axis=-1)
+    sum_abs = abs_e.sum(axis=-1)
+    sum_sq = (e * e).sum(axis=-1)
+
+    # MAPE: hanya actual != 0
+    pct_mask = valid & (y != 0)
+    ape = np.where(pct_mask, abs_e / np.where(pct_mask, np.abs(y), 1.0), 0.0)
+    # sMAPE: 2|e| / (|y| + |f|)
+    denom = np.abs(y) + np.abs(f)
+    s_mask = valid & (denom > 0)
+    sape = np.where(s_mask, 2 * abs_e / np.where(s_mask, denom, 1.0), 0.0)
+
+    # MASE & Theil's U memakai pasangan (t - season, t)
+    y_prev = y[..., :-season]
+    y_cur = y[..., season:]
+    naive_valid = np.isfinite(y_prev) & np.isfinite(y_cur)
+    naive_abs = np.where(naive_valid, np.abs(y_cur - y_prev), 0.0)
+    naive_mae = _safe_div(naive_abs.sum(axis=-1), naive_valid.sum(axis=-1))
+
+    u_mask = valid[..., season:] & naive_valid & (y_prev != 0)
+    y_prev_safe = np.where(u_mask, y_prev, 1.0)
+    u_num = np.where(u_mask, ((f[..., season:] - y_cur) / y_prev_safe) ** 2, 0.0).sum(axis=-1)
+    u_den = np.where(u_mask, ((y_cur - y_prev) / y_prev_safe) ** 2, 0.0).sum(axis=-1)
+
+    mae = _safe_div(sum_abs, n)
+    mse = _safe_div(sum_sq, n)
+    result = {
+        "MAE": mae,
+        "MSE": mse,
+        "RMSE": np.sqrt(mse),
+        "MAPE": _safe_div(ape.sum(axis=-1), pct_mask.sum(axis=-1)) * 100,
+        "sMAPE": _safe_div(sape.sum(axis=-1), s_mask.sum(axis=-1)) * 100,
+        "MASE": _safe_div(mae, naive_mae),
+        "TheilU": np.sqrt(_safe_div(u_num, u_den)),
+        "Bias": _safe_div(sum_e, n),
+    }
+    if result["MAE"].ndim == 0:
+        return {k: float(v) for k, v in result.items()}
+    return result
@@ -0,0 +1,335 @@
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from charts import forecast_chart, snapshot
+from des import des_smooth, des_forecast
+from holtwinters import hw_smooth, hw_forecast, hw_grid_search
+from drivers import lagged_design, search_driver_models, fit_driver_model, forecast_driver_model, describe_lags
+from metrics import compute_metrics
+from resample import resample_frame, future_periods, x_to_ordinal
+from shared_cache import make_key
+from shared_data import freeze
+
+# ====================== INCREMENTAL PIPELINE DAG ======================
+# Pipeline terdiri dari stage bernama. Key setiap stage = hash dari hash output
+# stage dependensinya + parameter yang benar-benar dipakai stage tersebut.
+# Jadi mengubah `periods_ahead` hanya menjalankan ulang forecast & render,
+# mengubah `alpha` tidak menyentuh load & interpolasi.
+#
+#   load -> resample -> clean -> select -> model -> forecast -> render
+#                                     \-> evaluate (select + model)
+#
+# Holt-Winters memakai cabang sendiri dari `select`: hw_model -> hw_forecast ->
+# hw_render dan hw_evaluate, dengan output berkunci sama seperti cabang DES.
+# Regresi driver + DES error: clean -> reg_search (semua kandidat driver/lag)
+# -> reg_model -> reg_forecast / reg_evaluate / reg_render.
+
+
+class Stage:
+    def __init__(self, name, func, deps=(), params=(), persist=True, version=1):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.params = tuple(params)
+        # persist=False: output hanya disimpan di memori proses (mis. snapshot grafik);
+        # persist=True: di shared cache, dengan salinan read-only di memori proses
+        self.persist = persist
+        self.version = version
+
+
+class _MemoryStore:
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return False, None
+            self._data.move_to_end(key)
+            return True, self._data[key]
+
+    def set(self, key, value, namespace=""):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def contains(self, key):
+        with self._lock:
+            return key in self._data
+
+
+class PipelineResult:
+    def __init__(self):
+        self.outputs = {}
+        self.report = []
+
+    def __getitem__(self, name):
+        return self.outputs[name]
+
+    def report_frame(self):
+        return pd.DataFrame(self.report, columns=["Stage", "Status", "Waktu (ms)"])
+
+
+class Pipeline:
+    def __init__(self, stages, store, memory_entries=64):
+        self.stages = {s.name: s for s in stages}
+        self.store = store
+        self.memory = _MemoryStore(memory_entries)
+        # key stage -> hash output, agar stage yang tidak berubah tidak perlu dimuat
+        self._hash_index = {}
+
+    def clear_memory(self):
+        self.memory = _MemoryStore(self.memory.max_entries)
+        self._hash_index = {}
+
+    def run(self, params, targets):
+        """Jalankan stage `targets` (dan dependensinya bila perlu)."""
+        return _Run(self, params).materialize_all(targets)
+
+    def key_for(self, name, params):
+        """Key cache stage `name` untuk `params` (dependensi di-resolve bila perlu)."""
+        return _Run(self, params).key_of(name)
+
+
+class _Run:
+    def __init__(self, pipeline, params):
+        self.p = pipeline
+        self.params = params
+        self.result = PipelineResult()
+        self.keys = {}
+        self.hashes = {}
+
+    def key_of(self, name):
+        if name not in self.keys:
+            stage = self.p.stages[name]
+            missing = [k for k in stage.params if k not in self.params]
+            if missing:
+                raise KeyError(f"Parameter untuk stage '{name}' belum diisi: {missing}")
+            self.keys[name] = make_key(
+                f"stage:{name}", stage.version, [self.hash_of(d) for d in stage.deps],
+                {k: self.params[k] for k in stage.params},
+            )
+        return self.keys[name]
+
+    def hash_of(self, name):
+        if name not in self.hashes:
+            key = self.key_of(name)
+            known = self.p._hash_index.get(key)
+            if known is None and self.p.stages[name].persist:
+                # Proses lain mungkin sudah menghitung stage ini: cukup ambil hash-nya
+                hit, known = self.p.store.get(key + ":hash")
+                known = known if hit else None
+            if known is not None:
+                self.p._hash_index[key] = known
+                self.hashes[name] = known
+                self.result.report.append((name, "unchanged", 0.0))
+            else:
+                self.materialize(name)
+        return self.hashes[name]
+
+    def materialize(self, name):
+        if name in self.result.outputs:
+            return self.result.outputs[name]
+        stage = self.p.stages[name]
+        key = self.key_of(name)
+        start = time.perf_counter()
+        # Memori proses dulu (objek read-only yang dipakai bersama semua sesi), lalu shared cache
+        hit, record = self.p.memory.get(key)
+        status = "memory"
+        if not hit and stage.persist:
+            hit, record = self.p.store.get(key)
+            if hit:
+                record = (record[0], freeze(record[1]))
+                self.p.memory.set(key, record)
+            status = "cached"
+        if hit:
+            out_hash, output = record
+        else:
+            inputs = [self.materialize(d) for d in stage.deps]
+            start = time.perf_counter()
+            output = freeze(stage.func(*inputs, **{k: self.params[k] for k in stage.params}))
+            # Output non-persisten (grafik) tidak di-hash; key stage sudah mewakili isinya
+            out_hash = make_key("output", output) if stage.persist else key
+            self.p.memory.set(key, (out_hash, output))
+            if stage.persist:
+                self.p.store.set(key, (out_hash, output), namespace=f"stage:{name}")
+                self.p.store.set(key + ":hash", out_hash, namespace="stage-hash")
+            status = "computed"
+        elapsed = (time.perf_counter() - start) * 1000
+        self.p._hash_index[key] = out_hash
+        self.hashes[name] = out_hash
+        self.result.outputs[name] = output
+        self.result.report = [r for r in self.result.report if r[0] != name]
+        self.result.report.append((name, status, elapsed))
+        return output
+
+    def materialize_all(self, targets):
+        for t in targets:
+            self.materialize(t)
+        return self.result
+
+
+# ====================== STAGE FORECAST GINI ======================
+
+def stage_load(path, mtime):
+    df = pd.read_csv(path) if path.lower().endswith('.csv') else pd.read_excel(path)
+    # Data bertanggal diurutkan di stage resample
+    return df.sort_values(by='Year') if 'Year' in df.columns else df
+
+
+def stage_resample(df_raw, freq, how):
+    # Sumber bertanggal (kolom Date) diagregasi ke frekuensi target; data tahunan dipakai apa adanya
+    if 'Date' in df_raw.columns:
+        return resample_frame(df_raw, 'Date', freq, how)
+    if freq != 'Y':
+        raise ValueError(f"Dataset hanya berisi kolom Year (tahunan), tidak bisa dipakai pada frekuensi '{freq}'")
+    return df_raw
+
+
+def stage_clean(df_raw):
+    # Sort berdasarkan Year lalu interpolasi linear semua kolom numerik selain Year
+    df_clean = df_raw.sort_values(by='Year').reset_index(drop=True)
+    numeric_cols = df_clean.select_dtypes(include='number').columns.tolist()
+    if 'Year' in numeric_cols:
+        numeric_cols.remove('Year')
+    for col in numeric_cols:
+        df_clean[col] = df_clean[col].interpolate(method='linear')
+    return df_clean
+
+
+def stage_select(df_clean, col, freq):
+    cols = ['Year', col] + (['Period'] if 'Period' in df_clean.columns else [])
+    df_sel = df_clean[cols].dropna()  # Drop rows yang masih NaN (misal di awal/akhir)
+    years = df_sel['Year'].values.astype(int if freq == 'Y' else float)
+    return {
+        "years": years,
+        "labels": df_sel['Period'].tolist() if 'Period' in df_sel.columns else [str(y) for y in years],
+        "last_period": int(x_to_ordinal(years[-1], freq)),
+        "Y": df_sel[col].values.astype(float),
+    }
+
+
+def stage_model(series, alpha):
+    return des_smooth(series["Y"], alpha)
+
+
+def stage_forecast(series, model, periods_ahead, freq):
+    future_years, future_labels = future_periods(series["last_period"], periods_ahead, freq)
+    return {
+        "future_years": future_years.tolist(),
+        "future_labels": future_labels,
+        "future_forecasts": des_forecast(model["a"][-1], model["b"][-1], periods_ahead),
+    }
+
+
+def stage_evaluate(series, model):
+    return compute_metrics(series["Y"], model["forecast"])
+
+
+def stage_render(series, model, forecast, alpha, chart_backend, chart_max_points, chart_method):
+    chart = forecast_chart(series["years"], series["Y"], model["forecast"], forecast["future_years"],
+                           forecast["future_forecasts"], alpha, backend=chart_backend,
+                           max_points=chart_max_points, method=chart_method)
+    return snapshot(chart)
+
+
+def stage_hw_model(series, seasonal, season_length, hw_alpha, hw_beta, hw_gamma, hw_optimize):
+    Y = series["Y"]
+    if hw_optimize:
+        # Semua kandidat (α, β, γ) dievaluasi sekaligus; yang dipakai = SSE one-step terkecil
+        best = hw_grid_search(Y, season_length, seasonal)
+        hw_alpha, hw_beta, hw_gamma = best["alpha"], best["beta"], best["gamma"]
+    return hw_smooth(Y, season_length, hw_alpha, hw_beta, hw_gamma, seasonal)
+
+
+def stage_hw_forecast(series, model, periods_ahead, freq):
+    future_years, future_labels = future_periods(series["last_period"], periods_ahead, freq)
+    return {
+        "future_years": future_years.tolist(),
+        "future_labels": future_labels,
+        "future_forecasts": hw_forecast(model, periods_ahead),
+    }
+
+
+def stage_hw_evaluate(series, model):
+    # MASE diskalakan dengan naive musiman
+    return compute_metrics(series["Y"], model["forecast"], season=model["season_length"])
+
+
+def stage_hw_render(series, model, forecast, chart_backend, chart_max_points, chart_method):
+    title = (f"Holt-Winters {model['seasonal']} (α = {model['alpha']:.2f}, β = {model['beta']:.2f}, "
+             f"γ = {model['gamma']:.2f}, m = {model['season_length']})")
+    chart = forecast_chart(series["years"], series["Y"], model["forecast"], forecast["future_years"],
+                           forecast["future_forecasts"], model["alpha"], backend=chart_backend,
+                           max_points=chart_max_points, method=chart_method, title=title)
+    return snapshot(chart)
+
+
+def stage_reg_search(df_clean, col, drivers, max_lag, criterion):
+    design = lagged_design(df_clean, col, drivers, max_lag)
+    return {"design": design, **search_driver_models(design, criterion)}
+
+
+def stage_reg_model(series, search, alpha):
+    design = search["design"]
+    fit = fit_driver_model(design, search["lags"][0], alpha)
+    # Disejajarkan dengan series target; baris di luar sampel bersama (lag awal) = NaN
+    pos = np.searchsorted(series["years"], design["years"])
+    aligned = {}
+    for key in ("regression", "residual", "a", "b", "forecast"):
+        aligned[key] = np.full(len(series["Y"]), np.nan)
+        aligned[key][pos] = fit[key]
+    return {**aligned, "fit": fit, "description": describe_lags(design["drivers"], fit["lags"])}
+
+
+def stage_reg_forecast(df_clean, search, model, periods_ahead, freq, alpha):
+    last_period = int(x_to_ordinal(search["design"]["years"][-1], freq))
+    future_years, future_labels = future_periods(last_period, periods_ahead, freq)
+    return {
+        "future_years": future_years.tolist(),
+        "future_labels": future_labels,
+        "future_forecasts": forecast_driver_model(df_clean, search["design"], model["fit"], periods_ahead, alpha),
+    }
+
+
+def stage_reg_render(series, model, forecast, alpha, chart_backend, chart_max_points, chart_method):
+    chart = forecast_chart(series["years"], series["Y"], model["forecast"], forecast["future_years"],
+                           forecast["future_forecasts"], alpha, backend=chart_backend,
+                           max_points=chart_max_points, method=chart_method,
+                           title=f"Regresi Driver + DES Error (α = {alpha}): {model['description']}")
+    return snapshot(chart)
+
+
+def build_forecast_pipeline(store):
+    return Pipeline([
+        Stage("load", stage_load, params=("path", "mtime")),
+        Stage("resample", stage_resample, deps=("load",), params=("freq", "how")),
+        Stage("clean", stage_clean, deps=("resample",)),
+        Stage("select", stage_select, deps=("clean",), params=("col", "freq")),
+        Stage("model", stage_model, deps=("select",), params=("alpha",)),
+        Stage("forecast", stage_forecast, deps=("select", "model"), params=("periods_ahead", "freq")),
+        Stage("evaluate", stage_evaluate, deps=("select", "model"), version=2),
+        Stage("render", stage_render, deps=("select", "model", "forecast"),
+              params=("alpha", "chart_backend", "chart_max_points", "chart_method"), persist=False),
+        Stage("hw_model", stage_hw_model, deps=("select",),
+              params=("seasonal", "season_length", "hw_alpha", "hw_beta", "hw_gamma", "hw_optimize"), version=2),
+        Stage("hw_forecast", stage_hw_forecast, deps=("select", "hw_model"), params=("periods_ahead", "freq")),
+        Stage("hw_evaluate", stage_hw_evaluate, deps=("select", "hw_model")),
+        Stage("hw_render", stage_hw_render, deps=("select", "hw_model", "hw_forecast"),
+              params=("chart_backend", "chart_max_points", "chart_method"), persist=False),
+        Stage("reg_search", stage_reg_search, deps=("clean",), params=("col", "drivers", "max_lag", "criterion")),
+        Stage("reg_model", stage_reg_model, deps=("select", "reg_search"), params=("alpha",)),
+        Stage("reg_forecast", stage_reg_forecast, deps=("clean", "reg_search", "reg_model"),
+              params=("periods_ahead", "freq", "alpha")),
+        Stage("reg_evaluate", stage_evaluate, deps=("select", "reg_model")),
+        Stage("reg_render", stage_reg_render, deps=("select", "reg_model", "reg_forecast"),
+              params=("alpha", "chart_backend", "chart_max_points", "chart_method"), persist=False),
+    ], store)
@@ -0,0 +1,210 @@
+import argparse
+import base64
+import html
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from charts import line_chart, forecast_chart
+from des import prepare_series, des_fit, mape_category
+from metrics import compute_metrics
+from resample import future_periods, ordinal_to_label, x_to_ordinal
+
+# ====================== REPORT EXPORT ======================
+# Laporan HTML mandiri (gambar di-embed sebagai base64 PNG) per series / alpha.
+# Semua grafik dari seluruh laporan dirender paralel di process pool, lalu
+# HTML disusun di proses utama.
+# Contoh CLI: python report.py --col gini_disp gini_mkt --alpha 0.3 0.6 --workers 4
+
+DEFAULT_DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "Income Inequality in South Africa_Dataset.xlsx")
+
+_CSS = """
+body {background:#0E1117; color:#E5E7EB; font-family:sans-serif; margin:40px;}
+h1, h2, h3 {color:#00E396;}
+table {border-collapse:collapse; margin:10px 0;}
+th, td {border:1px solid #334155; padding:4px 10px; text-align:right;}
+th {background:#1a202c;}
+.cards {display:flex; gap:16px;}
+.metric-card {background:linear-gradient(135deg,#1e242f,#2a3244); padding:16px 24px; border-radius:16px;
+              border:1px solid #334155; text-align:center;}
+.highlight-box {background:rgba(0,227,150,0.1); padding:15px; border-radius:10px; border:1px solid #00E396;}
+img {max-width:100%;}
+"""
+
+
+def quality_summary(df, col):
+    # Missing value, duplikasi, dan outlier (IQR) seperti halaman Data Understanding
+    df_q = df[['Year', col]]
+    Q1, Q3 = df_q[col].quantile(0.25), df_q[col].quantile(0.75)
+    IQR = Q3 - Q1
+    lower, upper = Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
+    return {
+        "Missing Value": int(df_q[col].isnull().sum()),
+        "Duplikasi Data": int(df_q.duplicated().sum()),
+        "Outlier": int(((df_q[col] < lower) | (df_q[col] > upper)).sum()),
+    }
+
+
+def build_report_data(df_raw, col, alpha, periods_ahead, title=None, freq="Y"):
+    """Semua angka untuk satu laporan (tanpa grafik)."""
+    df_sorted = df_raw.sort_values('Year').reset_index(drop=True)
+    years, Y = prepare_series(df_raw, col, freq)
+    periods = x_to_ordinal(years, freq)
+    future_years, future_labels = future_periods(periods[-1], periods_ahead, freq)
+    res = des_fit(Y, alpha, periods_ahead)
+    metrics = compute_metrics(Y, res["forecast"])
+    return {
+        "title": title or col,
+        "col": col,
+        "alpha": alpha,
+        "periods_ahead": periods_ahead,
+        "quality": quality_summary(df_raw, col),
+        "raw_years": df_sorted['Year'].to_numpy(),
+        "raw_values": df_sorted[col].to_numpy(dtype=float),
+        "interp_values": df_sorted[col].interpolate(method='linear').to_numpy(dtype=float),
+        "years": years,
+        "labels": ordinal_to_label(periods, freq),
+        "Y": Y,
+        "des": res,
+        "future_years": future_years.tolist(),
+        "future_labels": future_labels,
+        "metrics": metrics,
+        "mape_category": mape_category(metrics["MAPE"]),
+    }
+
+
+def _fig_to_base64(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, facecolor=fig.get_facecolor())
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def render_figures(data, max_points=2000):
+    # Fungsi top-level agar bisa dijalankan di process pool
+    interp = line_chart(
+        [
+            {'x': data["raw_years"], 'y': data["raw_values"], 'label': 'Before (Raw Data)',
+             'color': '#EF4444', 'marker': 'o', 'alpha': 0.7, 'markersize': 8},
+            {'x': data["raw_years"], 'y': data["interp_values"], 'label': 'After Interpolation',
+             'color': '#00E396', 'linewidth': 2.5},
+        ],
+        f"Perbandingan Interpolasi: {data['col']}", "Year", data["col"],
+        max_points=max_points, figsize=(12, 5)
+    )
+    forecast = forecast_chart(data["years"], data["Y"], data["des"]["forecast"], data["future_years"],
+                              data["des"]["future_forecasts"], data["alpha"], max_points=max_points)
+    return {"interpolation": _fig_to_base64(interp), "forecast": _fig_to_base64(forecast)}
+
+
+def _table(df):
+    return df.to_html(index=False, border=0, escape=True)
+
+
+def render_html(data, figures):
+    des = data["des"]
+    m = data["metrics"]
+    emoji, category = data["mape_category"]
+    calc = pd.DataFrame({
+        "No": np.arange(1, len(data["Y"]) + 1),
+        "Periode": data["labels"],
+        "Gini (Yt)": [f"{v:.4f}" for v in data["Y"]],
+        "S't": [f"{v:.4f}" for v in des["S1"]],
+        "S''t": [f"{v:.4f}" for v in des["S2"]],
+        "at": [f"{v:.4f}" for v in des["a"]],
+        "bt": [f"{v:.4f}" for v in des["b"]],
+        "Forecast": [f"{v:.4f}" if not np.isnan(v) else "-" for v in des["forecast"]],
+    })
+    pred = pd.DataFrame({
+        "Periode": data["future_labels"],
+        "Prediksi": [f"{v:.4f}" for v in des["future_forecasts"]],
+    })
+    quality = pd.DataFrame({"Aspek Kualitas Data": list(data["quality"]), "Jumlah": list(data["quality"].values())})
+    cards = "".join(
+        f"<div class='metric-card'><h3>{value}</h3><p>{name}</p></div>"
+        for name, value in [("MAE", f"{m['MAE']:.4f}"), ("MSE", f"{m['MSE']:.4f}"),
+                            ("RMSE", f"{m['RMSE']:.4f}"), ("MAPE", f"{emoji} {m['MAPE']:.2f}%")]
+    )
+    trend = 'meningkat' if des["future_forecasts"][-1] > data["Y"][-1] else 'menurun'
+    title = html.escape(str(data["title"]))
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Laporan Forecast - {title}</title><style>{_CSS}</style></head>
+<body>
+<h1>📊 Laporan Forecast: {title}</h1>
+<p>Double Exponential Smoothing (Brown) | α = {data['alpha']:.2f} | {data['periods_ahead']} periode ke depan</p>
+<h2>1. Ringkasan Kualitas Data</h2>
+{_table(quality)}
+<h2>2. Interpolasi</h2>
+<img src="data:image/png;base64,{figures['interpolation']}">
+<h2>3. Tabel Perhitungan DES</h2>
+{_table(calc)}
+<h2>4. Metrik Evaluasi</h2>
+<div class="cards">{cards}</div>
+<h3>Interpretasi MAPE</h3>
+<p>&lt; 5% Sangat Baik | 5-10% Baik | 10-20% Cukup | &gt; 20% Perlu Perbaikan</p>
+<div class="highlight-box">
+MAPE sebesar <strong>{m['MAPE']:.2f}%</strong> termasuk kategori <strong>{category}</strong>.
+Prediksi untuk {data['periods_ahead']} periode ke depan menunjukkan tren {trend} dari nilai terakhir
+{data['Y'][-1]:.4f} menjadi {des['future_forecasts'][-1]:.4f} pada periode {data['future_labels'][-1]}.
+</div>
+<h2>5. Forecast</h2>
+{_table(pred)}
+<img src="data:image/png;base64,{figures['forecast']}">
+</body></html>
+"""
+
+
+def build_report(df_raw, col, alpha, periods_ahead, title=None, freq="Y"):
+    """Satu laporan HTML (dipakai dari aplikasi untuk tombol download)."""
+    data = build_report_data(df_raw, col, alpha, periods_ahead, title, freq)
+    return render_html(data, render_figures(data))
+
+
+def report_filename(data):
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(data["title"])).strip("_")
+    return f"report_{slug}_{data['col']}_a{data['alpha']:.2f}_p{data['periods_ahead']}.html"
+
+
+def build_reports(jobs, out_dir, workers=None):
+    """Render banyak laporan; `jobs` berisi tuple (df_raw, col, alpha, periods_ahead, title)."""
+    os.makedirs(out_dir, exist_ok=True)
+    datas = [build_report_data(*job) for job in jobs]
+    n_workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        figures = list(pool.map(render_figures, datas, chunksize=max(1, len(datas) // (4 * n_workers))))
+    paths = []
+    for data, figs in zip(datas, figures):
+        path = os.path.join(out_dir, report_filename(data))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_html(data, figs))
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export laporan HTML forecast per series")
+    parser.add_argument("--input", nargs="+", default=[DEFAULT_DATASET], help="File Excel dataset")
+    parser.add_argument("--col", nargs="+", default=["gini_disp"], help="Kolom series yang dilaporkan")
+    parser.add_argument("--alpha", nargs="+", type=float, default=[0.60])
+    parser.add_argument("--periods", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses untuk render grafik")
+    parser.add_argument("--out", default="reports")
+    args = parser.parse_args(argv)
+
+    jobs = []
+    for path in args.input:
+        df = pd.read_excel(path).sort_values(by='Year')
+        name = os.path.splitext(os.path.basename(path))[0]
+        for col in args.col:
+            for alpha in args.alpha:
+                jobs.append((df, col, alpha, args.periods, name))
+    paths = build_reports(jobs, args.out, args.workers)
+    print(f"{len(paths)} laporan ditulis ke {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
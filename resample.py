@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+# ====================== TIME RESAMPLING ======================
+# Data bertanggal (harian/bulanan/kuartalan) diagregasi ke frekuensi target
+# (Y = tahunan, Q = kuartalan, M = bulanan). Periode direpresentasikan sebagai
+# ordinal integer sejak 1970 sehingga batas grup cukup dicari dengan satu
+# perbandingan array, lalu diagregasi dengan ufunc.reduceat.
+#
+# Kolom 'Year' pada hasil tetap dipakai sebagai sumbu-x numerik oleh pipeline
+# (2020, 2020.25, ...), kolom 'Period' berisi label periode ("2020", "2020Q2", "2020-05").
+
+PERIODS_PER_YEAR = {"Y": 1, "Q": 4, "M": 12}
+AGGREGATIONS = ("mean", "last", "first", "sum", "min", "max")
+PERIOD_NAMES = {"Y": "Tahun", "Q": "Kuartal", "M": "Bulan"}
+
+
+def _check_freq(freq):
+    if freq not in PERIODS_PER_YEAR:
+        raise ValueError(f"Frekuensi tidak dikenal: {freq} (pilih {list(PERIODS_PER_YEAR)})")
+
+
+def to_ordinal(timestamps, freq):
+    """Ordinal periode (integer sejak 1970) untuk setiap timestamp."""
+    _check_freq(freq)
+    months = np.asarray(timestamps, dtype="datetime64[M]").astype(np.int64)
+    return months // (12 // PERIODS_PER_YEAR[freq])
+
+
+def ordinal_to_x(ordinals, freq):
+    """Posisi numerik untuk sumbu-x: tahun (int) atau tahun pecahan (float)."""
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    if freq == "Y":
+        return ordinals + 1970
+    return 1970 + ordinals / PERIODS_PER_YEAR[freq]
+
+
+def x_to_ordinal(x, freq):
+    _check_freq(freq)
+    return np.rint((np.asarray(x, dtype=float) - 1970) * PERIODS_PER_YEAR[freq]).astype(np.int64)
+
+
+def ordinal_to_label(ordinals, freq):
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    per_year = PERIODS_PER_YEAR[freq]
+    year, sub = 1970 + ordinals // per_year, ordinals % per_year
+    if freq == "Y":
+        return [str(y) for y in year]
+    if freq == "Q":
+        return [f"{y}Q{s + 1}" for y, s in zip(year, sub)]
+    return [f"{y}-{s + 1:02d}" for y, s in zip(year, sub)]
+
+
+def future_periods(last_ordinal, periods_ahead, freq):
+    """(posisi-x, label) untuk `periods_ahead` periode setelah `last_ordinal`."""
+    ords = int(last_ordinal) + np.arange(1, periods_ahead + 1)
+    return ordinal_to_x(ords, freq), ordinal_to_label(ords, freq)
+
+
+def resample(timestamps, values, freq="Y", how="mean", fill_gaps=True):
+    """Agregasi `values` (n,) atau (n, k) per periode target.
+
+    NaN diabaikan di setiap agregasi; periode tanpa nilai valid menjadi NaN.
+    Dengan `fill_gaps`, periode kosong di tengah rentang ikut dimunculkan (NaN)
+    agar langkah interpolasi berikutnya bisa mengisinya.
+    Mengembalikan (ordinal unik, array agregat).
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Agregasi tidak dikenal: {how} (pilih {list(AGGREGATIONS)})")
+    timestamps = np.asarray(timestamps)
+    values = np.asarray(values, dtype=float)
+    squeeze = values.ndim == 1
+    if squeeze:
+        values = values[:, None]
+    # Urutkan menurut timestamp asli (bukan hanya periode) agar first/last di dalam
+    # satu periode adalah observasi paling awal/akhir, apa pun urutan barisnya
+    if len(timestamps) > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, values = timestamps[order], values[order]
+    ords = to_ordinal(timestamps, freq)
+    if len(ords) == 0:
+        return ords, values[:0, 0] if squeeze else values[:0]
+
+    starts = np.flatnonzero(np.r_[True, ords[1:] != ords[:-1]])
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid, starts, axis=0)
+    if how in ("mean", "sum"):
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = sums / counts if how == "mean" else sums
+    elif how in ("min", "max"):
+        out = (np.fmin if how == "min" else np.fmax).reduceat(values, starts, axis=0)
+    else:
+        pos = np.arange(len(ords))[:, None]
+        if how == "last":
+            idx = np.maximum.reduceat(np.where(valid, pos, -1), starts, axis=0)
+        else:
+            idx = np.minimum.reduceat(np.where(valid, pos, len(ords)), starts, axis=0)
+        out = np.take_along_axis(values, np.clip(idx, 0, len(ords) - 1), axis=0)
+    out = np.where(counts > 0, out, np.nan)
+    group_ords = ords[starts]
+
+    if fill_gaps and len(group_ords):
+        full = np.arange(group_ords[0], group_ords[-1] + 1)
+        filled = np.full((len(full), out.shape[1]), np.nan)
+        filled[group_ords - group_ords[0]] = out
+        group_ords, out = full, filled
+    return group_ords, out[:, 0] if squeeze else out
+
+
+def resample_frame(df, time_col="Date", freq="Y", how="mean"):
+    """Resample semua kolom numerik DataFrame bertanggal ke frekuensi target."""
+    value_cols = [c for c in df.select_dtypes(include="number").columns if c not in (time_col, "Year")]
+    timestamps = pd.to_datetime(df[time_col]).to_numpy(dtype="datetime64[ns]")
+    ords, agg = resample(timestamps, df[value_cols].to_numpy(dtype=float), freq, how)
+    out = pd.DataFrame(agg, columns=value_cols)
+    out.insert(0, "Year", ordinal_to_x(ords, freq))
+    out.insert(0, "Period", ordinal_to_label(ords, freq))
+    return out
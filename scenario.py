@@ -0,0 +1,89 @@
+import numpy as np
+
+# ====================== MONTE CARLO POLICY SCENARIO ======================
+# Brown DES ditulis dalam bentuk error-correction (setara Holt dengan
+# α_level = α(2-α), α_trend = α²):
+#   y(t+h) = L + B + e
+#   L     <- L + B + α(2-α)·e
+#   B     <- B + α²·e
+# Shock kebijakan ditambahkan ke level (L) dan trend (B). Semua path
+# disimulasikan sekaligus sebagai array (n_paths, horizon).
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def estimate_driver_effect(df, driver, col='gini_disp'):
+    """Slope OLS dari perubahan tahunan Gini terhadap perubahan tahunan driver."""
+    d = df[['Year', col, driver]].sort_values('Year').interpolate(method='linear').dropna()
+    dy = np.diff(d[col].to_numpy(dtype=float))
+    dx = np.diff(d[driver].to_numpy(dtype=float))
+    if len(dx) < 2 or np.allclose(dx, dx[0]):
+        return 0.0
+    dx_c = dx - dx.mean()
+    return float(np.dot(dx_c, dy - dy.mean()) / np.dot(dx_c, dx_c))
+
+
+def scenario_shifts(horizon, level_shock=0.0, level_shock_step=1, trend_change=0.0, trend_change_step=1,
+                    driver_deltas=None, driver_effect=0.0):
+    """Array (horizon,) perubahan level & trend yang diterapkan di awal tiap langkah.
+
+    `*_step` dihitung mulai 1 (= periode pertama forecast). `driver_deltas` adalah
+    perubahan driver per periode terhadap periode sebelumnya; efeknya masuk ke level.
+    """
+    level = np.zeros(horizon)
+    trend = np.zeros(horizon)
+    if level_shock and 1 <= level_shock_step <= horizon:
+        level[level_shock_step - 1] += level_shock
+    if trend_change and 1 <= trend_change_step <= horizon:
+        trend[trend_change_step - 1] += trend_change
+    if driver_deltas is not None and driver_effect:
+        deltas = np.zeros(horizon)
+        deltas[:min(horizon, len(driver_deltas))] = np.asarray(driver_deltas, dtype=float)[:horizon]
+        level += driver_effect * deltas
+    return level, trend
+
+
+def simulate_paths(a_last, b_last, alpha, residuals, horizon, n_paths=50000, level_shift=None,
+                   trend_shift=None, bootstrap=False, seed=None, dtype=np.float64):
+    """Simulasikan `n_paths` path forecast; hasil array (n_paths, horizon)."""
+    rng = np.random.default_rng(seed)
+    residuals = np.asarray(residuals, dtype=float)
+    residuals = residuals[np.isfinite(residuals)]
+    if bootstrap and len(residuals):
+        e = rng.choice(residuals, size=(n_paths, horizon)).astype(dtype, copy=False)
+    else:
+        sigma = float(np.sqrt(np.mean(residuals ** 2))) if len(residuals) else 0.0
+        e = rng.standard_normal((n_paths, horizon), dtype=dtype)
+        e *= sigma
+
+    k_level = alpha * (2 - alpha)
+    k_trend = alpha ** 2
+    level_shift = np.zeros(horizon) if level_shift is None else np.asarray(level_shift, dtype=float)
+    trend_shift = np.zeros(horizon) if trend_shift is None else np.asarray(trend_shift, dtype=float)
+
+    # Trend sebelum langkah h: b + Σ shift trend (s ≤ h) + α² Σ e (s < h)
+    cum_e = np.cumsum(e, axis=1)
+    cum_e_prev = np.zeros_like(e)
+    cum_e_prev[:, 1:] = cum_e[:, :-1]
+    trend = b_last + np.cumsum(trend_shift) + k_trend * cum_e_prev
+    # Level sebelum langkah h: a + Σ shift level (s ≤ h) + Σ trend (s < h) + α(2-α) Σ e (s < h)
+    trend_prev_sum = np.zeros_like(e)
+    trend_prev_sum[:, 1:] = np.cumsum(trend[:, :-1], axis=1)
+    level = a_last + np.cumsum(level_shift) + trend_prev_sum + k_level * cum_e_prev
+    return level + trend + e
+
+
+def summarize_paths(paths, threshold=None, quantiles=DEFAULT_QUANTILES, reference=None):
+    """Fan chart (quantile per horizon) dan metrik probabilitas."""
+    summary = {
+        "quantiles": {q: np.quantile(paths, q, axis=0) for q in quantiles},
+        "mean": paths.mean(axis=0),
+    }
+    if threshold is not None:
+        below = paths < threshold
+        summary["p_below_threshold"] = below.mean(axis=0)
+        summary["p_below_threshold_any"] = float(below.any(axis=1).mean())
+        summary["p_below_threshold_end"] = float(below[:, -1].mean())
+    if reference is not None:
+        summary["p_decrease_end"] = float((paths[:, -1] < reference).mean())
+    return summary
@@ -0,0 +1,240 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# ====================== SHARED RESULT CACHE ======================
+# Cache berbasis SQLite yang dipakai bersama oleh semua proses/replica Streamlit
+# di satu host. Setiap penulisan berjalan dalam satu transaksi (atomik), ukuran
+# total dibatasi dengan eviction LRU, dan statistik hit/miss disimpan di file
+# yang sama sehingga terlihat dari semua worker.
+#
+# Pembacaan hanya menjalankan SELECT (tanpa write-lock, sehingga pembaca WAL
+# berjalan paralel). Waktu akses untuk LRU dan counter hit/miss dikumpulkan di
+# memori lalu ditulis sekaligus setiap FLUSH_EVERY lookup / FLUSH_INTERVAL detik,
+# atau saat `set`/`stats`. Koneksi dibuka sekali per thread dan dipakai ulang.
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+FLUSH_EVERY = 64
+FLUSH_INTERVAL = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_STAT_NAMES = ("hits", "misses", "writes", "evictions")
+
+
+def _fingerprint(obj, h):
+    # Hash isi argumen secara stabil antar proses (tanpa bergantung pada id objek)
+    if isinstance(obj, pd.DataFrame):
+        h.update(b"df")
+        h.update(pickle.dumps(list(obj.columns)))
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b"sr")
+        h.update(pickle.dumps(obj.name))
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(b"nd")
+        h.update(str(obj.dtype).encode())
+        h.update(str(obj.shape).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"seq%d" % len(obj))
+        for item in obj:
+            _fingerprint(item, h)
+    elif isinstance(obj, dict):
+        h.update(b"map%d" % len(obj))
+        for k in sorted(obj, key=repr):
+            _fingerprint(k, h)
+            _fingerprint(obj[k], h)
+    else:
+        h.update(repr(obj).encode())
+
+
+def make_key(namespace, *args, **kwargs):
+    h = hashlib.sha256(namespace.encode())
+    _fingerprint(args, h)
+    _fingerprint(kwargs, h)
+    return h.hexdigest()
+
+
+class SharedCache:
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, timeout=30.0,
+                 flush_every=FLUSH_EVERY, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._pending_lock = threading.Lock()
+        self._pending_access = {}
+        self._pending_stats = dict.fromkeys(("hits", "misses"), 0)
+        self._last_flush = time.monotonic()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT OR IGNORE INTO stats(name, value) VALUES (?, 0)",
+            [(name,) for name in _STAT_NAMES],
+        )
+
+    def _conn(self):
+        # Satu koneksi per thread (sqlite3.Connection tidak boleh dipakai lintas thread);
+        # dibuka ulang setelah fork agar proses anak tidak memakai koneksi induk
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            # WAL: pembaca tidak terblokir oleh penulis; mmap: halaman dibagi antar proses via page cache OS
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={self.max_bytes}")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _bump(self, conn, name, amount=1):
+        if amount:
+            conn.execute("UPDATE stats SET value = value + ? WHERE name = ?", (amount, name))
+
+    def get(self, key):
+        """Kembalikan (hit, value)."""
+        row = self._conn().execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        with self._pending_lock:
+            if row is None:
+                self._pending_stats["misses"] += 1
+            else:
+                self._pending_stats["hits"] += 1
+                self._pending_access[key] = time.time()
+            due = (sum(self._pending_stats.values()) >= self.flush_every
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+        return (False, None) if row is None else (True, pickle.loads(row[0]))
+
+    def _take_pending(self):
+        with self._pending_lock:
+            access, stats = self._pending_access, self._pending_stats
+            self._pending_access = {}
+            self._pending_stats = dict.fromkeys(("hits", "misses"), 0)
+            self._last_flush = time.monotonic()
+        return access, stats
+
+    def _write_pending(self, conn, access, stats):
+        conn.executemany("UPDATE entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+                         [(t, k) for k, t in access.items()])
+        for name, amount in stats.items():
+            self._bump(conn, name, amount)
+
+    def flush(self):
+        """Tulis waktu akses dan counter hit/miss yang tertunda dalam satu transaksi."""
+        access, stats = self._take_pending()
+        if not access and not any(stats.values()):
+            return
+        self._transaction(lambda conn: self._write_pending(conn, access, stats))
+
+    def _transaction(self, func):
+        conn = self._conn()
+        # BEGIN IMMEDIATE: ambil write-lock di awal agar seluruh isi transaksi atomik
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            func(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def contains(self, key):
+        return self._conn().execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def set(self, key, value, namespace=""):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return False
+        now = time.time()
+        # Akses tertunda ikut ditulis agar urutan LRU untuk eviction akurat
+        access, stats = self._take_pending()
+
+        def write(conn):
+            self._write_pending(conn, access, stats)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries(key, namespace, value, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, blob, len(blob), now, now),
+            )
+            self._bump(conn, "writes")
+            self._evict(conn)
+
+        self._transaction(write)
+        return True
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self._bump(conn, "evictions", evicted)
+
+    def clear(self):
+        self._take_pending()
+
+        def wipe(conn):
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE stats SET value = 0")
+
+        self._transaction(wipe)
+
+    def stats(self):
+        self.flush()
+        conn = self._conn()
+        counters = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        by_ns = dict(conn.execute("SELECT namespace, COUNT(*) FROM entries GROUP BY namespace").fetchall())
+        lookups = counters.get("hits", 0) + counters.get("misses", 0)
+        return {
+            **counters,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hit_rate": counters.get("hits", 0) / lookups if lookups else 0.0,
+            "namespaces": by_ns,
+        }
+
+
+_default_cache = None
+
+
+def get_cache():
+    """Instance cache default; lokasi dan ukuran bisa diatur lewat environment variable."""
+    global _default_cache
+    if _default_cache is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        cache_dir = os.environ.get("GINI_CACHE_DIR", os.path.join(script_dir, ".cache"))
+        max_mb = float(os.environ.get("GINI_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)))
+        _default_cache = SharedCache(os.path.join(cache_dir, "shared_cache.sqlite"), int(max_mb * 1024 * 1024))
+    return _default_cache
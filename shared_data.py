@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+# ====================== SHARED READ-ONLY DATA ======================
+# Dataset dan output stage disimpan sekali per proses dan dipakai bersama oleh
+# semua halaman & sesi. Array di dalamnya dibuat read-only; dengan pandas
+# Copy-on-Write, seleksi kolom / sort / filter menjadi view tanpa salinan, dan
+# salinan baru dibuat otomatis hanya ketika sebuah stage benar-benar mengubah data.
+
+
+def enable_copy_on_write():
+    # pandas >= 3 selalu Copy-on-Write; pandas 2.x perlu diaktifkan manual
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+def _readonly(arr):
+    view = arr.view()
+    view.setflags(write=False)
+    return view
+
+
+def freeze(obj):
+    """Versi read-only dari output (DataFrame/Series/ndarray/dict/list/tuple) tanpa menyalin data."""
+    if isinstance(obj, pd.DataFrame):
+        if obj.columns.duplicated().any():
+            return obj
+        cols = {}
+        for col in obj.columns:
+            values = obj[col].to_numpy(copy=False)
+            # Kolom extension (mis. category) dibiarkan apa adanya
+            cols[col] = _readonly(values) if isinstance(values, np.ndarray) and obj[col].dtype == values.dtype else obj[col]
+        return pd.DataFrame(cols, index=obj.index, copy=False)
+    if isinstance(obj, pd.Series):
+        values = obj.to_numpy(copy=False)
+        if isinstance(values, np.ndarray) and obj.dtype == values.dtype:
+            return pd.Series(_readonly(values), index=obj.index, name=obj.name, copy=False)
+        return obj
+    if isinstance(obj, np.ndarray):
+        return _readonly(obj)
+    if isinstance(obj, dict):
+        return {k: freeze(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return tuple(freeze(v) for v in obj)
+    if isinstance(obj, list):
+        return [freeze(v) for v in obj]
+    return obj
@@ -0,0 +1,123 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# ====================== SPECULATIVE CACHE WARMER ======================
+# Setelah satu perhitungan selesai, parameter di sekitarnya (alpha ± 0.01..0.05,
+# horizon ± 1..2) dihitung di background dan disimpan ke shared cache, sehingga
+# geseran slider berikutnya langsung mendapat hasil dari cache.
+
+
+def neighbor_params(alpha, periods_ahead, alpha_steps=5, alpha_step=0.01, period_steps=2,
+                    alpha_range=(0.01, 0.99), period_range=(1, 20)):
+    """Daftar (alpha, periods_ahead) tetangga, diurutkan dari yang paling dekat."""
+    candidates = []
+    for k in range(1, max(alpha_steps, period_steps) + 1):
+        if k <= alpha_steps:
+            for sign in (1, -1):
+                a = round(alpha + sign * k * alpha_step, 2)
+                if alpha_range[0] <= a <= alpha_range[1]:
+                    candidates.append((a, periods_ahead))
+        if k <= period_steps:
+            for sign in (1, -1):
+                p = periods_ahead + sign * k
+                if period_range[0] <= p <= period_range[1]:
+                    candidates.append((alpha, p))
+    return candidates
+
+
+class CacheWarmer:
+    """Thread pool kecil yang mengisi shared cache untuk stage pipeline di sekitar permintaan terakhir.
+
+    `func(*args)` menjalankan pipeline untuk satu kombinasi parameter dan
+    `func.cache_key(*args)` memberi key stage-nya (untuk melewati yang sudah ada).
+    Budget CPU dibatasi lewat jumlah worker dan batas waktu per putaran. Putaran
+    dicatat per sesi: `schedule` hanya membatalkan putaran sebelumnya dari sesi
+    yang sama (user itu sudah pindah), bukan putaran milik sesi lain.
+    """
+
+    def __init__(self, func, cache, max_workers=1, time_budget=2.0):
+        self.func = func
+        self.cache = cache
+        self.time_budget = time_budget
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-warmer")
+        self._lock = threading.Lock()
+        self._round = 0
+        self._generations = {}
+        self._futures = {}
+        self._warmed_keys = set()
+        self.metrics = {
+            "scheduled": 0, "computed": 0, "skipped": 0, "cancelled": 0,
+            "expired": 0, "requests": 0, "warm_hits": 0, "busy_seconds": 0.0,
+        }
+
+    def schedule(self, calls, session=None):
+        """Jadwalkan daftar argumen (tuple) untuk dihangatkan; batalkan putaran sebelumnya dari `session`."""
+        self.cancel(session)
+        with self._lock:
+            # Sesi yang putarannya sudah selesai tidak perlu dicatat lagi
+            for other in [k for k, fs in self._futures.items() if all(f.done() for f in fs)]:
+                del self._futures[other]
+                self._generations.pop(other, None)
+            self._round += 1
+            generation = self._generations[session] = self._round
+            deadline = time.monotonic() + self.time_budget
+            futures = self._futures.setdefault(session, [])
+            for args in calls:
+                futures.append(self._pool.submit(self._warm, session, generation, deadline, args))
+                self.metrics["scheduled"] += 1
+
+    def cancel(self, session=None):
+        with self._lock:
+            self._generations.pop(session, None)
+            futures = self._futures.pop(session, [])
+            for f in futures:
+                if f.cancel():
+                    self.metrics["cancelled"] += 1
+            futures = [f for f in futures if not f.done()]
+            if futures:
+                self._futures[session] = futures
+
+    def _warm(self, session, generation, deadline, args):
+        with self._lock:
+            if generation != self._generations.get(session):
+                self.metrics["cancelled"] += 1
+                return
+        if time.monotonic() > deadline:
+            with self._lock:
+                self.metrics["expired"] += 1
+            return
+        key = self.func.cache_key(*args)
+        if self.cache.contains(key):
+            with self._lock:
+                self.metrics["skipped"] += 1
+            return
+        start = time.perf_counter()
+        self.func(*args)
+        with self._lock:
+            self.metrics["computed"] += 1
+            self.metrics["busy_seconds"] += time.perf_counter() - start
+            self._warmed_keys.add(key)
+
+    def note_request(self, *args):
+        """Catat permintaan foreground; dihitung sebagai warm hit jika hasilnya disiapkan warmer."""
+        key = self.func.cache_key(*args)
+        with self._lock:
+            self.metrics["requests"] += 1
+            if key in self._warmed_keys:
+                self._warmed_keys.discard(key)
+                self.metrics["warm_hits"] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.metrics)
+            stats["pending"] = sum(1 for fs in self._futures.values() for f in fs if not f.done())
+        stats["warm_hit_rate"] = stats["warm_hits"] / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+    def shutdown(self):
+        with self._lock:
+            sessions = list(self._futures)
+        for session in sessions:
+            self.cancel(session)
+        self._pool.shutdown(wait=False)